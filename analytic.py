@@ -0,0 +1,272 @@
+"""
+Closed-form frame and byte error rates of bounded-distance Reed-Solomon decoding.
+
+An (n, k) code with r = n - k parity bytes decodes a word with e byte errors
+and f erasures exactly when 2e + f <= r. With bytes corrupted independently,
+the error and erasure counts are binomial, so the failure probability is a
+binomial tail instead of something to simulate. Results are memoized in an
+on-disk shelve under the per-user cache directory (see cache_path()), so
+large capacity-planning grids are only ever computed once.
+
+Usage:
+    python analytic.py
+"""
+
+import atexit
+import dbm
+import math
+import os
+import shelve
+import threading
+from statistics import NormalDist
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from config import ANALYTIC_CACHE_ENV, ANALYTIC_CACHE_NAME, ERROR_CORRECTION_LEVELS
+
+# Channels accepted by symbol_error_rate()
+CHANNEL_SYMBOL = "symbol"  # value is the byte error probability itself
+CHANNEL_BSC = "bsc"        # value is the bit error probability
+CHANNEL_AWGN = "awgn"      # value is the noise sigma added to byte values
+
+
+class AnalyticResult(NamedTuple):
+    """Closed-form performance of one code on one channel condition."""
+    level: Optional[str]
+    channel: str
+    value: float
+    n: int
+    k: int
+    symbol_error_rate: float
+    erasure_rate: float
+    fer: float
+    ber: float   # expected wrong data bytes over k, as SimulationResult.ber
+
+
+def _log_pmf(n: int, j: int, p: float) -> float:
+    """Log of the Binomial(n, p) probability of exactly j successes."""
+    if p <= 0.0:
+        return 0.0 if j == 0 else -math.inf
+    if p >= 1.0:
+        return 0.0 if j == n else -math.inf
+    return (math.lgamma(n + 1) - math.lgamma(j + 1) - math.lgamma(n - j + 1)
+            + j * math.log(p) + (n - j) * math.log1p(-p))
+
+
+def _tail_terms(n: int, k: int, p: float) -> List[Tuple[int, float]]:
+    """(j, log P(X = j)) for j >= k, skipping zero-probability terms."""
+    terms = [(j, _log_pmf(n, j, p)) for j in range(max(k, 0), n + 1)]
+    return [(j, log_p) for j, log_p in terms if log_p != -math.inf]
+
+
+def binomial_tail(n: int, k: int, p: float) -> float:
+    """
+    Exact P(X >= k) for X ~ Binomial(n, p).
+
+    Terms are combined in log space, so tails far below the float64 epsilon
+    of 1 - P(X < k) stay accurate.
+    """
+    terms = _tail_terms(n, k, p)
+    if not terms:
+        return 0.0
+    top = max(log_p for _, log_p in terms)
+    return math.exp(top) * sum(math.exp(log_p - top) for _, log_p in terms)
+
+
+def binomial_tail_mean(n: int, k: int, p: float) -> float:
+    """E[X; X >= k] for X ~ Binomial(n, p), i.e. the sum of j * P(X = j) over the tail."""
+    terms = _tail_terms(n, k, p)
+    if not terms:
+        return 0.0
+    top = max(log_p for _, log_p in terms)
+    return math.exp(top) * sum(j * math.exp(log_p - top) for j, log_p in terms)
+
+
+def symbol_error_rate(channel: str, value: float) -> float:
+    """
+    Probability that a received byte is wrong on the given channel.
+
+    A byte survives a binary symmetric channel only if all 8 bits do; an
+    AWGN-disturbed byte is sliced wrong once the noise exceeds half a step
+    (values clipped at 0 or 255 are ignored, so this slightly overestimates).
+    """
+    if channel == CHANNEL_SYMBOL:
+        return value
+    if channel == CHANNEL_BSC:
+        return 1.0 - (1.0 - value) ** 8
+    if channel == CHANNEL_AWGN:
+        if value <= 0:
+            return 0.0
+        return 2.0 * (1.0 - NormalDist().cdf(0.5 / value))
+    raise ValueError(f"Unknown channel: {channel!r}")
+
+
+def code_for_level(level: str, message_len: Optional[int] = None) -> Tuple[int, int]:
+    """(n, k) of a level's code, a full 255-byte block unless message_len is given."""
+    n_parity = ERROR_CORRECTION_LEVELS[level]
+    k = message_len or 255 - n_parity
+    return k + n_parity, k
+
+
+_cache = None
+_cache_path: Optional[str] = None   # set_cache_path() override; None: cache_path()
+_cache_lock = threading.Lock()
+
+
+def cache_path() -> str:
+    """
+    Location of the on-disk cache.
+
+    The ANALYTIC_CACHE_ENV environment variable wins if set (an empty value
+    disables the disk cache); otherwise ANALYTIC_CACHE_NAME under
+    $XDG_CACHE_HOME, or ~/.cache.
+    """
+    if _cache_path is not None:
+        return _cache_path
+    override = os.environ.get(ANALYTIC_CACHE_ENV)
+    if override is not None:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, ANALYTIC_CACHE_NAME)
+
+
+def set_cache_path(path: Optional[str]):
+    """
+    Move the on-disk cache to path ("" keeps results in memory only; None
+    restores the default). Results cached so far stay where they were.
+    """
+    global _cache, _cache_path
+    with _cache_lock:
+        if _cache is not None and not isinstance(_cache, dict):
+            _cache.close()
+        _cache = None
+        _cache_path = path
+
+
+def _open_cache():
+    """The shelve at cache_path(), or an in-memory dict if it cannot be opened."""
+    path = cache_path()
+    if path:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            cache = shelve.open(path)
+        except (OSError, *dbm.error):
+            pass  # read-only or unavailable location: memoize in memory
+        else:
+            atexit.register(cache.close)
+            return cache
+    return {}
+
+
+def _cached(name: str, args: tuple, compute):
+    """Look a result up in the result cache, computing and storing it on a miss."""
+    global _cache
+    key = f"{name}{args!r}"
+    with _cache_lock:
+        if _cache is None:
+            _cache = _open_cache()
+        if key in _cache:
+            return _cache[key]
+        value = compute(*args)
+        _cache[key] = value
+        return value
+
+
+def _error_rates(n: int, k: int, p_symbol: float, p_erasure: float) -> Tuple[float, float]:
+    """Uncached (fer, ber) of an (n, k) code; see error_rates()."""
+    r = n - k
+    # Given f erasures, each remaining byte is in error with this probability
+    p_error = p_symbol / (1.0 - p_erasure) if p_erasure < 1.0 else 0.0
+    fer = wrong_bytes = 0.0
+    for f in range(n + 1):
+        log_f = _log_pmf(n, f, p_erasure)
+        if log_f == -math.inf:
+            continue
+        weight = math.exp(log_f)
+        # Decoding fails once 2e + f > r
+        first_failing = 0 if f > r else (r - f) // 2 + 1
+        tail = binomial_tail(n - f, first_failing, p_error)
+        fer += weight * tail
+        wrong_bytes += weight * (f * tail + binomial_tail_mean(n - f, first_failing, p_error))
+    # Errata land on every position alike, so a failed frame's data bytes
+    # hold k / n of its wrong bytes: wrong data bytes over k = wrong_bytes / n
+    wrong_data_bytes = wrong_bytes * k / n
+    return min(fer, 1.0), min(wrong_data_bytes / k, 1.0)
+
+
+def error_rates(n: int, k: int, p_symbol: float, p_erasure: float = 0.0) -> Tuple[float, float]:
+    """
+    Frame and residual byte error rate of bounded-distance decoding.
+
+    Every byte is independently erased with probability p_erasure, otherwise
+    wrong with probability p_symbol (so p_symbol + p_erasure <= 1). Frames with
+    2e + f > n - k fail and are assumed to keep all their errors and erasures;
+    frames within the bound decode perfectly. An erased data byte of a failed
+    frame counts as wrong, since its value cannot be trusted.
+
+    Args:
+        n: Codeword length
+        k: Data bytes per codeword
+        p_symbol: Probability that a byte is received wrong
+        p_erasure: Probability that a byte is flagged as erased
+
+    Returns:
+        Tuple of (fer, ber), ber being the expected number of wrong data
+        bytes per frame over k, the definition SimulationResult.ber uses
+    """
+    if not 0 < k < n <= 255:
+        raise ValueError(f"Invalid code: n={n}, k={k}")
+    if p_symbol < 0 or p_erasure < 0 or p_symbol + p_erasure > 1:
+        raise ValueError("Byte error and erasure probabilities must be valid and sum to at most 1.")
+    return _cached("error_rates", (n, k, float(p_symbol), float(p_erasure)), _error_rates)
+
+
+def level_performance(level: str, channel: str, value: float,
+                      message_len: Optional[int] = None,
+                      erasure_rate: float = 0.0) -> AnalyticResult:
+    """
+    Closed-form performance of an error correction level on a channel.
+
+    Args:
+        level: Error correction level from ERROR_CORRECTION_LEVELS
+        channel: CHANNEL_SYMBOL, CHANNEL_BSC or CHANNEL_AWGN
+        value: Byte error rate, bit error rate or noise sigma respectively
+        message_len: Data bytes per codeword (defaults to a full block)
+        erasure_rate: Probability that a byte arrives flagged as erased
+    """
+    n, k = code_for_level(level, message_len)
+    p_symbol = symbol_error_rate(channel, value) * (1.0 - erasure_rate)
+    fer, ber = error_rates(n, k, p_symbol, erasure_rate)
+    return AnalyticResult(level, channel, value, n, k, p_symbol, erasure_rate, fer, ber)
+
+
+def performance_table(channel: str, values: Iterable[float],
+                      levels: Optional[Iterable[str]] = None,
+                      message_len: Optional[int] = None) -> List[AnalyticResult]:
+    """level_performance() for every level and channel value."""
+    values = list(values)
+    return [
+        level_performance(level, channel, value, message_len)
+        for level in levels or ERROR_CORRECTION_LEVELS
+        for value in values
+    ]
+
+
+def format_table(results: List[AnalyticResult]) -> str:
+    """Render analytic results as a text table."""
+    lines = [f"{'Level':<6}{'Code':>11}{'Channel':>9}{'Value':>10}{'p_symbol':>11}{'FER':>12}{'BER':>12}"]
+    for r in results:
+        code = f"({r.n},{r.k})"
+        lines.append(
+            f"{r.level or '-':<6}{code:>11}{r.channel:>9}{r.value:>10.4g}"
+            f"{r.symbol_error_rate:>11.3e}{r.fer:>12.3e}{r.ber:>12.3e}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Print FER/BER of every level over a range of bit error rates."""
+    print(format_table(performance_table(CHANNEL_BSC, (1e-2, 3e-3, 1e-3, 1e-4))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""NumPy-vectorized Reed-Solomon kernels that process many codewords at once."""
+
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from gf256 import GF_MUL
+from table_codec import TableRSCodec, UncorrectableError
+
+# GF(2^8) multiplication table as an array: GF_MUL_NP[a, b] == a * b
+GF_MUL_NP = np.frombuffer(b"".join(GF_MUL), dtype=np.uint8).reshape(256, 256)
+
+MessageBatch = Union[np.ndarray, Sequence[Union[str, bytes, bytearray, memoryview]]]
+# A (batch, n) bool mask, or one list of erased positions per row
+ErasureBatch = Union[np.ndarray, Sequence[Sequence[int]]]
+
+
+def as_message_array(messages: MessageBatch) -> np.ndarray:
+    """
+    Convert a batch of messages into a 2-D uint8 array, one message per row.
+
+    Messages of different lengths are left-padded with zero bytes. Leading
+    zeros do not change Reed-Solomon parity, so the padded codeword and the
+    unpadded one share the same parity bytes.
+
+    Args:
+        messages: A 2-D uint8 array, or a list of str/bytes-like messages
+
+    Returns:
+        A C-contiguous (batch, length) uint8 array
+    """
+    if isinstance(messages, np.ndarray):
+        if messages.ndim != 2:
+            raise ValueError("Message arrays must be 2-D (batch, length).")
+        return np.ascontiguousarray(messages, dtype=np.uint8)
+
+    rows = [m.encode("utf-8") if isinstance(m, str) else bytes(m) for m in messages]
+    width = max((len(r) for r in rows), default=0)
+    padded = b"".join(r.rjust(width, b"\0") for r in rows)
+    return np.frombuffer(padded, dtype=np.uint8).reshape(len(rows), width).copy()
+
+
+def parity_feedback(codec: TableRSCodec) -> np.ndarray:
+    """
+    Per-coefficient parity feedback table for a codec.
+
+    Returns:
+        A (nsym, 256) uint8 array; column c is the generator tail scaled by c
+    """
+    return np.ascontiguousarray(GF_MUL_NP[:, codec.gen[1:]].T)
+
+
+def _divide_columns(codec: TableRSCodec, work: np.ndarray) -> None:
+    """
+    Synthetic division by the generator over a column-major batch, in place.
+
+    Args:
+        codec: Codec supplying the generator polynomial
+        work: (n, batch) uint8 array of polynomial coefficients, highest
+            degree first; afterwards its last nsym rows hold the remainders
+    """
+    feedback = parity_feedback(codec)
+    nsym = codec.nsym
+    for i in range(work.shape[0] - nsym):
+        work[i + 1:i + 1 + nsym] ^= feedback[:, work[i]]
+
+
+def encode_batch(codec: TableRSCodec, messages: MessageBatch,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute the codewords of a whole batch of single-block messages.
+
+    Synthetic division runs once per message column, with every step a table
+    gather across the entire batch, instead of once per message byte.
+
+    Args:
+        codec: Codec supplying the generator polynomial
+        messages: Batch of messages, each at most nsize - nsym bytes
+        out: Optional (batch, length + nsym) uint8 array to write the
+            codewords into, e.g. a view of a memory-mapped file
+
+    Returns:
+        A (batch, length + nsym) uint8 array of codewords (out, if given)
+    """
+    data = as_message_array(messages)
+    batch, k = data.shape
+    nsym = codec.nsym
+    if k > codec.block_data_size:
+        raise ValueError(f"Messages are limited to {codec.block_data_size} bytes per codeword.")
+
+    # Column-major work area: row i holds coefficient i of every message,
+    # so each division step touches contiguous memory.
+    work = np.zeros((k + nsym, batch), dtype=np.uint8)
+    work[:k] = data.T
+    _divide_columns(codec, work)
+
+    codewords = np.empty((batch, k + nsym), dtype=np.uint8) if out is None else out
+    if codewords.shape != (batch, k + nsym):
+        raise ValueError(f"Output array must have shape {(batch, k + nsym)}.")
+    codewords[:, :k] = data
+    codewords[:, k:] = work[k:].T
+    return codewords
+
+
+class BatchDecodeResult(NamedTuple):
+    """Outcome of decode_batch(), one entry per codeword row."""
+    data: np.ndarray       # (batch, length - nsym) view of the data columns
+    success: np.ndarray    # bool, False where the row could not be repaired
+    corrected: np.ndarray  # number of repaired errata (errors + erasures) per row
+
+
+def batch_remainders(codec: TableRSCodec, codewords: np.ndarray) -> np.ndarray:
+    """
+    Divide every codeword by the generator polynomial in one vectorized pass.
+
+    A codeword's remainder is zero exactly when all of its syndromes are zero,
+    and the division is several times cheaper than evaluating nsym syndromes.
+
+    Args:
+        codec: Codec supplying the generator polynomial
+        codewords: (batch, n) uint8 array
+
+    Returns:
+        A (nsym, batch) uint8 array; a column is all zero iff that row is a
+        valid codeword
+    """
+    work = np.array(codewords.T, order="C")  # always a copy: division is in place
+    _divide_columns(codec, work)
+    return work[-codec.nsym:]
+
+
+def decode_batch(codec: TableRSCodec, codewords: MessageBatch,
+                 erasures: Optional[ErasureBatch] = None) -> BatchDecodeResult:
+    """
+    Decode a batch of single-block codewords, repairing only the dirty rows.
+
+    The syndrome check for the whole batch is a single vectorized division by
+    the generator. Rows that divide evenly are returned as-is; the remaining rows go through
+    Berlekamp-Massey, Chien search and Forney one at a time and are repaired
+    in place.
+
+    Args:
+        codec: Codec supplying the generator polynomial
+        codewords: A (batch, n) uint8 array, or a list of codewords (shorter
+            ones are left-padded with zeros). A writable uint8 array is used
+            without copying, so its rows are corrected in place.
+        erasures: Optional known-bad positions per row (bool mask or position
+            lists). Each erasure costs one parity byte instead of two; they are
+            only consulted for rows that fail the syndrome check.
+
+    Returns:
+        BatchDecodeResult whose data field is a zero-copy view of the data
+        columns of the (repaired) codeword array
+    """
+    array = as_message_array(codewords)
+    if not array.flags.writeable:
+        array = array.copy()
+    batch, n = array.shape
+    if not codec.nsym < n <= codec.nsize:
+        raise ValueError(f"Codewords must be {codec.nsym + 1} to {codec.nsize} bytes long.")
+
+    success = np.ones(batch, dtype=bool)
+    corrected = np.zeros(batch, dtype=np.intp)
+    dirty = np.flatnonzero(batch_remainders(codec, array).any(axis=0))
+    for row in dirty:
+        block = bytearray(array[row].tobytes())
+        if erasures is None:
+            erase_pos = []
+        elif isinstance(erasures, np.ndarray):
+            erase_pos = np.flatnonzero(erasures[row]).tolist()
+        else:
+            erase_pos = sorted(set(erasures[row]))
+        try:
+            corrected[row] = len(codec.correct_block(block, erase_pos))
+        except UncorrectableError:
+            success[row] = False
+            continue
+        array[row] = np.frombuffer(block, dtype=np.uint8)
+
+    return BatchDecodeResult(array[:, :n - codec.nsym], success, corrected)
@@ -0,0 +1,317 @@
+"""NumPy-vectorized corruption channels that corrupt many codewords at once."""
+
+from typing import Optional
+
+import math
+
+import numpy as np
+
+from config import CORRUPTION_MODE_AWGN, CORRUPTION_MODE_BURST, CORRUPTION_MODE_GE, CORRUPTION_MODE_BSC
+from corruption import CorruptionLog, GilbertElliott, gilbert_elliott_for
+
+
+def sample_positions(rng: np.random.Generator, trials: int, n: int, n_errors: int) -> np.ndarray:
+    """
+    Draw n_errors distinct positions in [0, n) for every row.
+
+    Few errors per row are drawn with replacement and only the rows that
+    repeat a position are redrawn; otherwise each row takes the indices of its
+    n_errors smallest uniform keys. Both give a uniformly random subset, and
+    the positions of a row are returned sorted, as apply_corruption() does.
+
+    Returns:
+        A (trials, n_errors) intp array
+    """
+    if n_errors > n:
+        raise ValueError(f"Cannot corrupt {n_errors} distinct bytes of a {n}-byte codeword.")
+    if n_errors == n:
+        return np.broadcast_to(np.arange(n), (trials, n)).copy()
+    if n_errors == 0:
+        return np.empty((trials, 0), dtype=np.intp)
+    if n_errors * n_errors <= 2 * n:
+        # Birthday bound: at least ~1/e of the rows are already distinct
+        positions = np.sort(rng.integers(0, n, size=(trials, n_errors), dtype=np.intp), axis=1)
+        redo = np.flatnonzero((np.diff(positions, axis=1) == 0).any(axis=1))
+        while redo.size:
+            fresh = np.sort(rng.integers(0, n, size=(redo.size, n_errors), dtype=np.intp), axis=1)
+            positions[redo] = fresh
+            redo = redo[(np.diff(fresh, axis=1) == 0).any(axis=1)]
+        return positions
+    keys = rng.random((trials, n))
+    positions = np.argpartition(keys, n_errors - 1, axis=1)[:, :n_errors]
+    positions.sort(axis=1)
+    return positions
+
+
+def _xor_rows(codewords: np.ndarray, positions: np.ndarray,
+              rng: np.random.Generator) -> CorruptionLog:
+    """XOR the given (trials, k) positions of each row with non-zero random masks."""
+    xor_values = rng.integers(1, 256, size=positions.shape, dtype=np.uint8)
+    rows = np.arange(codewords.shape[0])[:, None]
+    original = codewords[rows, positions]
+    new = original ^ xor_values
+    codewords[rows, positions] = new
+    return CorruptionLog(positions, original, xor_values, new)
+
+
+def corrupt_batch_xor(codewords: np.ndarray, n_errors: int,
+                      rng: np.random.Generator) -> CorruptionLog:
+    """
+    XOR n_errors distinct bytes of every row with non-zero random masks.
+
+    Args:
+        codewords: (trials, n) uint8 array, modified in place
+        n_errors: Bytes to corrupt per row
+        rng: Random source
+
+    Returns:
+        CorruptionLog of (trials, n_errors) arrays; delta holds the XOR masks
+    """
+    trials, n = codewords.shape
+    return _xor_rows(codewords, sample_positions(rng, trials, n, n_errors), rng)
+
+
+def corrupt_batch_burst(codewords: np.ndarray, length: int,
+                        rng: np.random.Generator) -> CorruptionLog:
+    """
+    XOR one burst of consecutive bytes at a random offset in every row.
+
+    Args:
+        codewords: (trials, n) uint8 array, modified in place
+        length: Burst length in bytes
+        rng: Random source
+
+    Returns:
+        CorruptionLog of (trials, length) arrays; delta holds the XOR masks
+    """
+    trials, n = codewords.shape
+    if length > n:
+        raise ValueError(f"Cannot fit a {length}-byte burst in a {n}-byte codeword.")
+    starts = rng.integers(0, n - length + 1, size=(trials, 1))
+    return _xor_rows(codewords, starts + np.arange(length), rng)
+
+
+def gilbert_elliott_mask(rng: np.random.Generator, trials: int, n: int,
+                         channel: GilbertElliott) -> np.ndarray:
+    """
+    Error pattern of a Gilbert-Elliott channel for every row.
+
+    The Markov state advances one byte at a time, but each step updates all
+    rows at once; every chain starts from the stationary distribution.
+
+    Returns:
+        A (trials, n) bool array, True where a byte is corrupted
+    """
+    # Column-major so each step touches contiguous memory
+    bad = np.empty((n, trials), dtype=bool)
+    state = rng.random(trials) < channel.stationary_bad
+    steps = rng.random((n, trials))
+    for pos in range(n):
+        bad[pos] = state
+        state = np.where(state, steps[pos] >= channel.p_bad_to_good, steps[pos] < channel.p_good_to_bad)
+    error_p = np.where(bad, channel.error_bad, channel.error_good)
+    return (rng.random((n, trials)) < error_p).T
+
+
+def corrupt_batch_mask(codewords: np.ndarray, mask: np.ndarray,
+                       rng: np.random.Generator) -> CorruptionLog:
+    """
+    XOR every byte selected by a (trials, n) mask with a non-zero random value.
+
+    The number of corrupted bytes varies per row, so the log is flat:
+    positions index codewords.ravel() (row = position // n).
+
+    Args:
+        codewords: C-contiguous (trials, n) uint8 array, modified in place
+        mask: Bool array of the same shape
+        rng: Random source
+
+    Returns:
+        CorruptionLog of 1-D arrays
+    """
+    if not codewords.flags.c_contiguous:
+        raise ValueError("Codeword batch must be C-contiguous.")
+    flat = codewords.reshape(-1)
+    positions = np.flatnonzero(mask)
+    xor_values = rng.integers(1, 256, size=positions.shape, dtype=np.uint8)
+    original = flat[positions]
+    new = original ^ xor_values
+    flat[positions] = new
+    return CorruptionLog(positions, original, xor_values, new)
+
+
+def count_mask(rng: np.random.Generator, counts: np.ndarray, n: int) -> np.ndarray:
+    """
+    Uniformly random positions with a per-row error count.
+
+    Each row ranks n uniform keys and keeps the counts[i] smallest, so given
+    its count every subset of positions is equally likely.
+
+    Returns:
+        A (len(counts), n) bool array with counts[i] True entries in row i
+    """
+    counts = np.asarray(counts)
+    if (counts < 0).any() or (counts > n).any():
+        raise ValueError(f"Error counts must lie in [0, {n}].")
+    ranks = np.argsort(np.argsort(rng.random((counts.size, n)), axis=1), axis=1)
+    return ranks < counts[:, None]
+
+
+def corrupt_batch_counts(codewords: np.ndarray, counts: np.ndarray,
+                         rng: np.random.Generator) -> CorruptionLog:
+    """
+    XOR counts[i] distinct random bytes of row i with non-zero random masks.
+
+    Args:
+        codewords: C-contiguous (trials, n) uint8 array, modified in place
+        counts: Error count per row
+        rng: Random source
+
+    Returns:
+        Flat CorruptionLog as from corrupt_batch_mask()
+    """
+    trials, n = codewords.shape
+    if len(counts) != trials:
+        raise ValueError("Need one error count per codeword.")
+    return corrupt_batch_mask(codewords, count_mask(rng, counts, n), rng)
+
+
+def corrupt_batch_gilbert_elliott(codewords: np.ndarray, channel: GilbertElliott,
+                                  rng: np.random.Generator) -> CorruptionLog:
+    """
+    Corrupt every row as if sent over a Gilbert-Elliott burst channel.
+
+    Args:
+        codewords: C-contiguous (trials, n) uint8 array, modified in place
+        channel: Channel parameters, e.g. from gilbert_elliott_for()
+        rng: Random source
+
+    Returns:
+        Flat CorruptionLog as from corrupt_batch_mask()
+    """
+    trials, n = codewords.shape
+    return corrupt_batch_mask(codewords, gilbert_elliott_mask(rng, trials, n, channel), rng)
+
+
+def corrupt_batch_awgn(codewords: np.ndarray, n_errors: int, sigma: float,
+                       rng: np.random.Generator) -> CorruptionLog:
+    """
+    Add Gaussian noise to n_errors distinct bytes of every row.
+
+    Noisy values are rounded to the nearest byte and clipped to [0, 255],
+    matching corrupt_with_awgn().
+
+    Args:
+        codewords: (trials, n) uint8 array, modified in place
+        n_errors: Bytes to disturb per row
+        sigma: Standard deviation of the Gaussian noise
+        rng: Random source
+
+    Returns:
+        CorruptionLog of (trials, n_errors) arrays; delta holds the noise
+    """
+    trials, n = codewords.shape
+    positions = sample_positions(rng, trials, n, n_errors)
+    noise = rng.normal(0.0, sigma, size=positions.shape)
+    rows = np.arange(trials)[:, None]
+    original = codewords[rows, positions]
+    new = np.clip(np.rint(original + noise), 0, 255).astype(np.uint8)
+    codewords[rows, positions] = new
+    return CorruptionLog(positions, original, noise, new)
+
+
+def bsc_flip_positions(rng: np.random.Generator, n_bits: int, bit_error_rate: float) -> np.ndarray:
+    """
+    Flipped bit indices of an n_bits-long binary symmetric channel.
+
+    Gaps between flips are drawn from the geometric distribution in blocks
+    sized from the expected flip count, so the work is proportional to the
+    number of flips; a BER of 1e-7 over gigabytes costs a few thousand draws.
+
+    Returns:
+        Sorted int64 array of flipped bit indices
+    """
+    if bit_error_rate <= 0 or n_bits == 0:
+        return np.empty(0, dtype=np.int64)
+    if bit_error_rate >= 1:
+        return np.arange(n_bits, dtype=np.int64)
+    expected = n_bits * bit_error_rate
+    block = int(expected + 6 * math.sqrt(expected)) + 16
+    parts = []
+    last = -1
+    while last < n_bits:
+        flips = last + np.cumsum(rng.geometric(bit_error_rate, size=block))
+        parts.append(flips)
+        last = int(flips[-1])
+    flips = np.concatenate(parts)
+    return flips[:np.searchsorted(flips, n_bits)]
+
+
+def corrupt_buffer_bsc(buffer: np.ndarray, bit_error_rate: float,
+                       rng: np.random.Generator) -> CorruptionLog:
+    """
+    Flip every bit of a flat buffer independently with probability bit_error_rate.
+
+    Bit 0 is the most significant bit of byte 0. The buffer may be any
+    C-contiguous uint8 array, e.g. a whole batch of codewords or a view of a
+    memory-mapped file.
+
+    Args:
+        buffer: C-contiguous uint8 array, modified in place
+        bit_error_rate: Bit flip probability
+        rng: Random source
+
+    Returns:
+        Flat CorruptionLog with one entry per corrupted byte; positions index
+        buffer.ravel() and delta holds the combined bit masks
+    """
+    if not buffer.flags.c_contiguous:
+        raise ValueError("Buffer must be C-contiguous.")
+    flat = buffer.reshape(-1)
+    bits = bsc_flip_positions(rng, flat.size * 8, bit_error_rate)
+    byte_pos = bits >> 3
+    bit_masks = (0x80 >> (bits & 7)).astype(np.uint8)
+    # Bits are sorted, so flips within one byte are adjacent
+    starts = np.flatnonzero(np.diff(byte_pos, prepend=-1))
+    positions = byte_pos[starts]
+    xor_values = np.bitwise_or.reduceat(bit_masks, starts) if starts.size else bit_masks
+    original = flat[positions]
+    new = original ^ xor_values
+    flat[positions] = new
+    return CorruptionLog(positions, original, xor_values, new)
+
+
+def corrupt_batch(codewords: np.ndarray, n_errors: int, mode: str,
+                  noise_sigma: Optional[float] = None,
+                  rng: Optional[np.random.Generator] = None,
+                  bit_error_rate: Optional[float] = None) -> CorruptionLog:
+    """
+    Vectorized counterpart of apply_corruption() for a whole batch.
+
+    Args:
+        codewords: (trials, n) uint8 array, modified in place
+        n_errors: Number of bytes to corrupt per row (the burst length in
+            burst mode, the average count in Gilbert-Elliott mode, unused
+            in BSC mode)
+        mode: Corruption mode ('1' XOR, '2' AWGN, '3' burst, '4' Gilbert-Elliott,
+            '5' binary symmetric channel)
+        noise_sigma: Standard deviation for AWGN mode
+        rng: Random source (a fresh unseeded generator if None)
+        bit_error_rate: Bit flip probability for BSC mode
+
+    Returns:
+        CorruptionLog of (trials, n_errors) arrays, row i of each array being
+        the log of codeword i; flat arrays for the Gilbert-Elliott and BSC
+        channels
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if mode == CORRUPTION_MODE_AWGN:
+        return corrupt_batch_awgn(codewords, n_errors, noise_sigma, rng)
+    if mode == CORRUPTION_MODE_BURST:
+        return corrupt_batch_burst(codewords, n_errors, rng)
+    if mode == CORRUPTION_MODE_GE:
+        channel = gilbert_elliott_for(n_errors, codewords.shape[1])
+        return corrupt_batch_gilbert_elliott(codewords, channel, rng)
+    if mode == CORRUPTION_MODE_BSC:
+        return corrupt_buffer_bsc(codewords, bit_error_rate, rng)
+    return corrupt_batch_xor(codewords, n_errors, rng)
@@ -0,0 +1,139 @@
+"""
+Throughput benchmark for the Reed-Solomon codec backends.
+
+Reports bytes/sec (of message data) for encoding, decoding a clean stream and
+decoding a stream with the maximum correctable number of errors per block,
+for every entry in ERROR_CORRECTION_LEVELS and every codec backend.
+
+A second table compares encode_batch()/decode_batch() against per-message loops.
+
+Usage:
+    python benchmark.py [payload_bytes]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List, Tuple
+
+from config import ERROR_CORRECTION_LEVELS, CODEC_BACKEND_REEDSOLO, CODEC_BACKEND_TABLE
+from reed_solomon_codec import ReedSolomonEncoder
+
+BENCH_BACKENDS = (CODEC_BACKEND_REEDSOLO, CODEC_BACKEND_TABLE)
+BENCH_PAYLOAD_BYTES = 32 * 1024
+BENCH_REPEAT = 3
+BENCH_BATCH_RECORDS = 20000
+
+
+def time_best(func: Callable[[], object], repeat: int = BENCH_REPEAT) -> float:
+    """Return the best wall-clock time (seconds) of several runs of func."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def corrupt_every_block(codeword: bytes, n_errors: int, block_size: int = 255) -> bytearray:
+    """
+    Corrupt n_errors random bytes inside every block of a chunked codeword.
+
+    Args:
+        codeword: Concatenated codewords
+        n_errors: Number of bytes to corrupt per block
+        block_size: Codeword length of a full block
+
+    Returns:
+        The corrupted copy
+    """
+    corrupted = bytearray(codeword)
+    for start in range(0, len(corrupted), block_size):
+        block_len = min(block_size, len(corrupted) - start)
+        for pos in random.sample(range(block_len), min(n_errors, block_len)):
+            corrupted[start + pos] ^= random.randint(1, 255)
+    return corrupted
+
+
+def bench_backend(backend: str, n_parity: int, payload: bytes) -> Tuple[float, float, float]:
+    """
+    Measure one backend at one parity level.
+
+    Returns:
+        Tuple of (encode_bps, clean_decode_bps, noisy_decode_bps)
+    """
+    codec = ReedSolomonEncoder(n_parity, backend=backend).rs
+    encoded = bytes(codec.encode(payload))
+    noisy = bytes(corrupt_every_block(encoded, n_parity // 2))
+
+    size = len(payload)
+    encode_time = time_best(lambda: codec.encode(payload))
+    clean_time = time_best(lambda: codec.decode(encoded))
+    noisy_time = time_best(lambda: codec.decode(noisy))
+    return size / encode_time, size / clean_time, size / noisy_time
+
+
+def run_benchmark(payload_size: int = BENCH_PAYLOAD_BYTES) -> List[Tuple[str, str, float, float, float]]:
+    """
+    Benchmark every backend at every error correction level.
+
+    Returns:
+        List of (level, backend, encode_bps, clean_decode_bps, noisy_decode_bps)
+    """
+    random.seed(0)
+    payload = bytes(random.getrandbits(8) for _ in range(payload_size))
+    rows = []
+    for level, n_parity in ERROR_CORRECTION_LEVELS.items():
+        for backend in BENCH_BACKENDS:
+            rows.append((level, backend) + bench_backend(backend, n_parity, payload))
+    return rows
+
+
+def bench_batch(level: str = "H", n_records: int = BENCH_BATCH_RECORDS) -> List[Tuple[str, float, float]]:
+    """
+    Compare the batch APIs with per-message encode()/decode() loops on small records.
+
+    Returns:
+        List of (operation, loop_records_per_sec, batch_records_per_sec)
+    """
+    encoder = ReedSolomonEncoder(ERROR_CORRECTION_LEVELS[level])
+    records = [f"record-{i:08d}-payload" for i in range(n_records)]
+    codewords = encoder.encode_batch(records)
+    received = [row.tobytes() for row in codewords]
+
+    def encode_loop():
+        for record in records:
+            encoder.encode(record)
+
+    def decode_loop():
+        for codeword in received:
+            encoder.decode(codeword)
+
+    rows = []
+    for name, loop, batch in (
+        ("encode", encode_loop, lambda: encoder.encode_batch(records)),
+        ("decode", decode_loop, lambda: encoder.decode_batch(codewords)),
+    ):
+        loop_time = time_best(loop, repeat=1)
+        batch_time = time_best(batch)
+        rows.append((name, n_records / loop_time, n_records / batch_time))
+    return rows
+
+
+def main():
+    """Run the benchmark and print a table of throughputs."""
+    payload_size = int(sys.argv[1]) if len(sys.argv) > 1 else BENCH_PAYLOAD_BYTES
+    print(f"Payload: {payload_size} bytes (best of {BENCH_REPEAT})")
+    print(f"{'Level':<6}{'Backend':<10}{'encode B/s':>14}{'decode B/s':>14}{'repair B/s':>14}")
+    for level, backend, enc, clean, noisy in run_benchmark(payload_size):
+        print(f"{level:<6}{backend:<10}{enc:>14,.0f}{clean:>14,.0f}{noisy:>14,.0f}")
+    print()
+
+    print(f"Level H, {BENCH_BATCH_RECORDS} small records (records/s):")
+    print(f"{'':<8}{'loop':>14}{'batch':>14}{'speedup':>10}")
+    for name, loop_rate, batch_rate in bench_batch():
+        print(f"{name:<8}{loop_rate:>14,.0f}{batch_rate:>14,.0f}{batch_rate / loop_rate:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+Non-interactive command line interface to the Reed-Solomon toolkit.
+
+Every subcommand reads files or stdin, takes its parameters as flags and
+prints one JSON object to stdout, so runs can be scripted and parsed:
+
+    python cli.py encode -l H -i message.txt -o message.rs
+    python cli.py decode -l H -i message.rs -o message.txt
+    echo -n hello | python cli.py encode -l M
+    python cli.py corrupt -i message.rs -o noisy.rs --mode xor --errors 10 --seed 1
+    python cli.py simulate --levels L H --errors 4 5 --sigmas 0.2 --trials 2000
+    python cli.py bench --payload-size 65536
+    tar cf - docs | python cli.py stream-encode -l H | nc host 9000
+    nc -l 9000 | python cli.py stream-decode -l H | tar xf -
+
+Binary output goes to --output; without it the bytes are embedded in the JSON
+as hex. decode exits with status 1 if any block could not be repaired.
+
+stream-encode and stream-decode are pipe filters: codewords or data go to
+stdout as each read is processed, and the optional JSON report goes to stderr.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+from typing import BinaryIO, List, Optional
+
+from config import (
+    ERROR_CORRECTION_LEVELS, CORRUPTION_MODE_XOR, CORRUPTION_MODE_AWGN,
+    CORRUPTION_MODE_BURST, CORRUPTION_MODE_GE, CORRUPTION_MODE_BSC,
+    SIM_DEFAULT_TRIALS, STREAM_FILTER_CHUNK_BLOCKS
+)
+
+# --mode accepts these names as well as the menu numbers used by main.py
+MODE_NAMES = {
+    "xor": CORRUPTION_MODE_XOR,
+    "awgn": CORRUPTION_MODE_AWGN,
+    "burst": CORRUPTION_MODE_BURST,
+    "ge": CORRUPTION_MODE_GE,
+    "bsc": CORRUPTION_MODE_BSC,
+}
+
+
+def corruption_mode(value: str) -> str:
+    """argparse type for --mode: a mode name or its number."""
+    mode = MODE_NAMES.get(value.lower(), value)
+    if mode not in MODE_NAMES.values():
+        raise argparse.ArgumentTypeError(f"unknown corruption mode {value!r}")
+    return mode
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for counts that cannot be negative."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    """argparse type for sizes that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
+
+
+def non_negative_float(value: str) -> float:
+    """argparse type for noise levels that cannot be negative."""
+    number = float(value)
+    if not number >= 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return number
+
+
+def probability(value: str) -> float:
+    """argparse type for a probability in [0, 1]."""
+    number = float(value)
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 1, got {value}")
+    return number
+
+
+def open_input(path: str) -> BinaryIO:
+    """Binary reader for a path, or stdin for '-'."""
+    return sys.stdin.buffer if path == "-" else open(path, "rb")
+
+
+def emit(report: dict, out=None):
+    """Print a JSON report on one line (to stdout unless out is given)."""
+    out = out or sys.stdout
+    json.dump(report, out, separators=(",", ":"))
+    out.write("\n")
+
+
+def cmd_encode(args) -> int:
+    """Encode a file or stdin with encode_stream()."""
+    from rs_stream import encode_stream
+
+    src = open_input(args.input)
+    dst = open(args.output, "wb") if args.output else io.BytesIO()
+    try:
+        report = encode_stream(src, dst, args.level)
+        result = {"command": "encode", "level": args.level, **report._asdict()}
+        if not args.output:
+            result["codewords_hex"] = dst.getvalue().hex()
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        dst.close()
+    emit(result)
+    return 0
+
+
+def cmd_decode(args) -> int:
+    """Decode a file or stdin with decode_stream()."""
+    from rs_stream import decode_stream
+
+    src = open_input(args.input)
+    dst = open(args.output, "wb") if args.output else io.BytesIO()
+    try:
+        report = decode_stream(src, dst, args.level)
+        result = {"command": "decode", "level": args.level,
+                  "success": report.failed_blocks == 0, **report._asdict()}
+        if not args.output:
+            result["data_hex"] = dst.getvalue().hex()
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        dst.close()
+    emit(result)
+    return 0 if result["success"] else 1
+
+
+def cmd_stream(args) -> int:
+    """Filter stdin to stdout through encode_stream() or decode_stream()."""
+    from rs_stream import decode_stream, encode_stream
+
+    run = encode_stream if args.command == "stream-encode" else decode_stream
+    try:
+        report = run(sys.stdin.buffer, sys.stdout.buffer, args.level,
+                     chunk_blocks=args.chunk_blocks, flush=True)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    failed = getattr(report, "failed_blocks", 0)
+    if args.report:
+        emit({"command": args.command, "level": args.level,
+              "success": failed == 0, **report._asdict()}, sys.stderr)
+    return 0 if failed == 0 else 1
+
+
+def cmd_corrupt(args) -> int:
+    """Apply one corruption model to a file or stdin."""
+    import random
+    from corruption import apply_corruption
+
+    src = open_input(args.input)
+    try:
+        data = src.read()
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+    if args.mode in (CORRUPTION_MODE_XOR, CORRUPTION_MODE_AWGN, CORRUPTION_MODE_BURST) \
+            and args.errors > len(data):
+        emit({"command": "corrupt", "mode": args.mode,
+              "error": f"cannot corrupt {args.errors} of {len(data)} bytes"})
+        return 1
+    corrupted, positions, changes = apply_corruption(
+        data, args.errors, args.mode, args.sigma, random.Random(args.seed),
+        compact=True, bit_error_rate=args.ber
+    )
+    result = {
+        "command": "corrupt",
+        "mode": args.mode,
+        "bytes": len(data),
+        "positions": [int(pos) for pos in positions],
+        "changes": [[int(pos), int(orig), float(delta) if args.mode == CORRUPTION_MODE_AWGN else int(delta), int(new)]
+                    for pos, orig, delta, new in zip(*changes)],
+    }
+    if args.output:
+        with open(args.output, "wb") as dst:
+            dst.write(corrupted)
+    else:
+        result["corrupted_hex"] = corrupted.hex()
+    emit(result)
+    return 0
+
+
+def cmd_simulate(args) -> int:
+    """Run a Monte Carlo sweep and report every operating point."""
+    from simulation import channel_label, operating_points, sweep
+
+    points = operating_points(args.levels, error_counts=args.errors, sigmas=args.sigmas,
+                              burst_lengths=args.bursts, ge_mean_errors=args.ge,
+                              bit_error_rates=args.bers, message_len=args.message_len)
+    if args.checkpoint:
+        from sim_checkpoint import checkpointed_sweep
+        results = checkpointed_sweep(points, args.checkpoint, args.trials, args.seed,
+                                     workers=args.workers, shard=tuple(args.shard or (0, 1)))
+    else:
+        results = sweep(points, args.trials, args.seed, workers=args.workers)
+
+    rows = []
+    for r in results:
+        low, high = r.fer_interval
+        rows.append({
+            **r.point._asdict(),
+            "channel": channel_label(r.point),
+            "trials": r.trials,
+            "frame_errors": r.frame_errors,
+            "byte_errors": r.byte_errors,
+            "fer": r.fer,
+            "fer_ci": [low, high],
+            "ber": r.ber,
+        })
+    emit({"command": "simulate", "seed": args.seed, "results": rows})
+    return 0
+
+
+def cmd_bench(args) -> int:
+    """Run the throughput benchmark."""
+    from benchmark import bench_batch, run_benchmark
+
+    rows = [
+        {"level": level, "backend": backend, "encode_bps": enc,
+         "clean_decode_bps": clean, "noisy_decode_bps": noisy}
+        for level, backend, enc, clean, noisy in run_benchmark(args.payload_size)
+    ]
+    result = {"command": "bench", "payload_size": args.payload_size, "backends": rows}
+    if args.batch:
+        result["batch"] = [
+            {"operation": name, "loop_records_per_sec": loop_rate, "batch_records_per_sec": batch_rate}
+            for name, loop_rate, batch_rate in bench_batch()
+        ]
+    emit(result)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser with one subparser per command."""
+    parser = argparse.ArgumentParser(prog="cli.py", description="Reed-Solomon toolkit (JSON output)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    levels = sorted(ERROR_CORRECTION_LEVELS)
+
+    for name, func, help_text in (("encode", cmd_encode, "encode data into codewords"),
+                                  ("decode", cmd_decode, "decode and repair codewords")):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("-l", "--level", choices=levels, default="H", help="error correction level")
+        sub.add_argument("-i", "--input", default="-", help="input file ('-' for stdin)")
+        sub.add_argument("-o", "--output", help="output file (default: hex inside the JSON)")
+        sub.set_defaults(func=func)
+
+    for name, help_text in (("stream-encode", "encode stdin to stdout as a pipe filter"),
+                            ("stream-decode", "decode stdin to stdout as a pipe filter")):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("-l", "--level", choices=levels, default="H", help="error correction level")
+        sub.add_argument("--chunk-blocks", type=positive_int, default=STREAM_FILTER_CHUNK_BLOCKS,
+                         help="largest number of codewords processed per read")
+        sub.add_argument("--report", action="store_true", help="print a JSON report to stderr")
+        sub.set_defaults(func=cmd_stream)
+
+    sub = commands.add_parser("corrupt", help="corrupt bytes with a channel model")
+    sub.add_argument("-i", "--input", default="-", help="input file ('-' for stdin)")
+    sub.add_argument("-o", "--output", help="output file (default: hex inside the JSON)")
+    sub.add_argument("-m", "--mode", type=corruption_mode, default=CORRUPTION_MODE_XOR,
+                     help="xor, awgn, burst, ge or bsc (or 1-5)")
+    sub.add_argument("-e", "--errors", type=non_negative_int, default=0,
+                     help="bytes to corrupt (burst length for burst, mean for ge)")
+    sub.add_argument("--sigma", type=non_negative_float, help="noise standard deviation for awgn")
+    sub.add_argument("--ber", type=probability, help="bit error probability for bsc")
+    sub.add_argument("--seed", type=int, help="random seed")
+    sub.set_defaults(func=cmd_corrupt)
+
+    sub = commands.add_parser("simulate", help="Monte Carlo FER/BER sweep")
+    sub.add_argument("--levels", nargs="+", choices=levels, help="levels to sweep (default: all)")
+    sub.add_argument("--errors", nargs="*", type=non_negative_int, default=[], help="XOR error counts")
+    sub.add_argument("--sigmas", nargs="*", type=non_negative_float, default=[], help="AWGN noise sigmas")
+    sub.add_argument("--bursts", nargs="*", type=non_negative_int, default=[], help="burst lengths")
+    sub.add_argument("--ge", nargs="*", type=non_negative_int, default=[],
+                     help="Gilbert-Elliott mean error counts")
+    sub.add_argument("--bers", nargs="*", type=probability, default=[], help="BSC bit error probabilities")
+    sub.add_argument("--message-len", type=positive_int, help="data bytes per codeword (default: full block)")
+    sub.add_argument("--trials", type=positive_int, default=SIM_DEFAULT_TRIALS, help="trials per point")
+    sub.add_argument("--seed", type=int, default=0, help="master seed")
+    sub.add_argument("--workers", type=positive_int, help="worker processes (default: CPU count)")
+    sub.add_argument("--checkpoint", help="resumable checkpoint file")
+    sub.add_argument("--shard", nargs=2, type=int, metavar=("INDEX", "COUNT"),
+                     help="run only this share of the chunks (with --checkpoint)")
+    sub.set_defaults(func=cmd_simulate)
+
+    sub = commands.add_parser("bench", help="codec throughput benchmark")
+    sub.add_argument("--payload-size", type=int, default=32 * 1024, help="payload bytes per run")
+    sub.add_argument("--batch", action="store_true", help="also compare batch and loop APIs")
+    sub.set_defaults(func=cmd_bench)
+    return parser
+
+
+def check_args(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """Reject option combinations argparse cannot express (exits with usage)."""
+    if args.command == "corrupt":
+        if args.mode == CORRUPTION_MODE_AWGN and args.sigma is None:
+            parser.error("corrupt: --mode awgn requires --sigma")
+        if args.mode == CORRUPTION_MODE_BSC and args.ber is None:
+            parser.error("corrupt: --mode bsc requires --ber")
+    elif args.command == "simulate":
+        for level in args.levels or ERROR_CORRECTION_LEVELS:
+            n_parity = ERROR_CORRECTION_LEVELS[level]
+            if args.message_len is not None and args.message_len > 255 - n_parity:
+                parser.error(f"simulate: --message-len is at most {255 - n_parity} at level {level}")
+            n = (args.message_len or 255 - n_parity) + n_parity
+            too_many = [count for count in args.errors + args.bursts if count > n]
+            if too_many:
+                parser.error(f"simulate: cannot corrupt {max(too_many)} bytes of a "
+                             f"{n}-byte level {level} codeword")
+        if args.shard is not None:
+            if not args.checkpoint:
+                parser.error("simulate: --shard requires --checkpoint")
+            index, count = args.shard
+            if not 0 <= index < count:
+                parser.error("simulate: --shard needs 0 <= INDEX < COUNT")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse the command line and run the chosen command."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    check_args(parser, args)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
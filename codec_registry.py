@@ -0,0 +1,136 @@
+"""Process-wide, thread-safe cache of Reed-Solomon codec instances."""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Tuple, Type
+
+from config import (
+    CODEC_BACKEND_REEDSOLO, CODEC_BACKEND_TABLE, CODEC_CACHE_SIZE, DEFAULT_CODEC_BACKEND, GF_PRIM
+)
+
+# Backends are imported when their first codec is built: reedsolo or the
+# table codec (whose GF(2^8) tables take a few ms) are only loaded if used
+PRIM = GF_PRIM
+
+
+def build_codec(backend: str, n_parity: int, nsize: int = 255, fcr: int = 0,
+                prim: int = PRIM, generator: int = 2):
+    """
+    Construct a new codec for the given backend and parameters.
+
+    Args:
+        backend: Codec backend ('reedsolo' or 'table')
+        n_parity: Number of parity bytes per block
+        nsize: Maximum codeword length
+        fcr: First consecutive root exponent
+        prim: Primitive polynomial of the field
+        generator: Primitive element of the field
+
+    Returns:
+        An RSCodec or TableRSCodec instance
+    """
+    if backend == CODEC_BACKEND_REEDSOLO:
+        from reedsolo import RSCodec
+        return RSCodec(n_parity, nsize=nsize, fcr=fcr, prim=prim, generator=generator)
+    if backend == CODEC_BACKEND_TABLE:
+        if prim != PRIM:
+            raise ValueError(f"The table backend only supports prim={PRIM:#x}.")
+        from table_codec import TableRSCodec
+        return TableRSCodec(n_parity, nsize=nsize, fcr=fcr, generator=generator)
+    raise ValueError(f"Unknown codec backend: {backend!r}")
+
+
+class CodecRegistry:
+    """
+    LRU cache of codec instances keyed by backend and code parameters.
+
+    Building a codec computes its generator polynomial (and, for reedsolo, its
+    field tables), so encoders for the same level should share one instance.
+    Cached codecs are never mutated after construction; reedsolo instances
+    built with a non-default prim still swap reedsolo's module-level tables on
+    every call, so do not mix fields across threads with that backend.
+    """
+
+    def __init__(self, max_size: int = CODEC_CACHE_SIZE):
+        """
+        Args:
+            max_size: Maximum number of codecs kept before evicting the least
+                recently used one
+        """
+        self.max_size = max_size
+        self._codecs: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, n_parity: int, nsize: int = 255, fcr: int = 0, prim: int = PRIM,
+            generator: int = 2, backend: str = DEFAULT_CODEC_BACKEND):
+        """
+        Return the cached codec for these parameters, building it on a miss.
+
+        Args:
+            n_parity: Number of parity bytes per block
+            nsize: Maximum codeword length
+            fcr: First consecutive root exponent
+            prim: Primitive polynomial of the field
+            generator: Primitive element of the field
+            backend: Codec backend ('reedsolo' or 'table')
+        """
+        key: Tuple = (backend, n_parity, nsize, fcr, prim, generator)
+        with self._lock:
+            codec = self._codecs.get(key)
+            if codec is not None:
+                self._codecs.move_to_end(key)
+                self.hits += 1
+                return codec
+
+            # Built under the lock so concurrent misses construct only once
+            codec = build_codec(backend, n_parity, nsize, fcr, prim, generator)
+            self.misses += 1
+            self._codecs[key] = codec
+            if len(self._codecs) > self.max_size:
+                self._codecs.popitem(last=False)
+                self.evictions += 1
+            return codec
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the cache counters, for monitoring."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._codecs),
+                "max_size": self.max_size,
+            }
+
+    def clear(self):
+        """Drop every cached codec and reset the counters."""
+        with self._lock:
+            self._codecs.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# The shared registry used by ReedSolomonEncoder
+_registry = CodecRegistry()
+
+
+def get_codec(n_parity: int, nsize: int = 255, fcr: int = 0, prim: int = PRIM,
+              generator: int = 2, backend: str = DEFAULT_CODEC_BACKEND):
+    """Fetch a codec from the process-wide registry."""
+    return _registry.get(n_parity, nsize, fcr, prim, generator, backend)
+
+
+def decode_errors(backend: str) -> Tuple[Type[Exception], ...]:
+    """Exceptions a backend's decode() raises for uncorrectable input."""
+    if backend == CODEC_BACKEND_REEDSOLO:
+        from reedsolo import ReedSolomonError
+        return (ReedSolomonError,)
+    from table_codec import UncorrectableError
+    return (UncorrectableError,)
+
+
+def get_registry() -> CodecRegistry:
+    """Return the process-wide registry (e.g. to read stats() or clear it)."""
+    return _registry
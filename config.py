@@ -9,6 +9,57 @@ ERROR_CORRECTION_LEVELS = {
 #Corruption modes
 CORRUPTION_MODE_XOR = "1"
 CORRUPTION_MODE_AWGN = "2"
+CORRUPTION_MODE_BURST = "3"  # one run of consecutive corrupted bytes
+CORRUPTION_MODE_GE = "4"     # Gilbert-Elliott two-state Markov channel
+CORRUPTION_MODE_BSC = "5"    # binary symmetric channel: independent bit flips
+
+# Gilbert-Elliott channel: leaving the bad state and byte error rate per state
+# (the good-to-bad rate is derived from the requested mean error count)
+GE_P_BAD_TO_GOOD = 0.2  # mean bad-state dwell of 5 bytes
+GE_ERROR_GOOD = 0.0
+GE_ERROR_BAD = 0.5
+
+# Codec backends
+CODEC_BACKEND_REEDSOLO = "reedsolo"  # reedsolo's pure-Python RSCodec
+CODEC_BACKEND_TABLE = "table"        # in-project table-driven GF(2^8) engine
+DEFAULT_CODEC_BACKEND = CODEC_BACKEND_REEDSOLO
+CODEC_CACHE_SIZE = 16  # codec instances kept by the process-wide registry
+GF_PRIM = 0x11d        # primitive polynomial of GF(2^8), reedsolo's default
+
+# Streaming: codewords per read/write (memory use is this times 255 bytes)
+STREAM_CHUNK_BLOCKS = 256
+STREAM_FILTER_CHUNK_BLOCKS = 1024  # largest read of the stdin/stdout filter (cli.py)
+
+# Parallel codec: shards handed to each worker process (for load balancing)
+PARALLEL_SHARDS_PER_WORKER = 4
+
+# Monte Carlo simulation
+SIM_BATCH_SIZE = 4096        # trials encoded/decoded per vectorized batch
+SIM_DEFAULT_TRIALS = 10000   # trials per operating point
+SIM_CONFIDENCE_Z = 1.96      # z-score of the reported confidence intervals (95%)
+SIM_CHUNK_TRIALS = 2048      # trials per independently seeded work unit
+# Adaptive stopping: a point finishes at the first of these criteria
+SIM_TARGET_REL_CI = 0.1      # FER confidence half-width relative to the FER
+SIM_MIN_FAILURES = 100       # observed frame errors
+SIM_MAX_TRIALS = 10_000_000  # trials spent on a single point
+SIM_CHECKPOINT_EVERY = 16    # finished chunks between checkpoint writes
+
+# Analytic performance: shelve file memoizing closed-form results, kept in
+# the per-user cache directory ($XDG_CACHE_HOME or ~/.cache) unless the
+# environment variable names another path ("" keeps results in memory only)
+ANALYTIC_CACHE_NAME = "reed_solomon/analytic"
+ANALYTIC_CACHE_ENV = "RS_ANALYTIC_CACHE"
+
+# Startup: budget for `import main` / `import cli` (see startup_benchmark.py)
+STARTUP_BUDGET_MS = 60
+
+# Demo output: arrays longer than RENDER_MAX_ITEMS are summarized
+RENDER_MAX_ITEMS = 64        # items (or lines) printed in full
+RENDER_EDGE_ITEMS = 16       # items kept at each end of a summarized array
+RENDER_WINDOW_RADIUS = 8     # bytes shown either side of a corrupted position
+RENDER_MAX_WINDOWS = 16      # hex windows printed per codeword
+HEXDUMP_WIDTH = 16           # bytes per hexdump row
+HEXDUMP_PAGE_LINES = 24      # hexdump rows per page
 
 ANIMATION_STEPS = 3
 ANIMATION_DELAY = 0.4
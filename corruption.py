@@ -1,23 +1,150 @@
 
-import random
-from typing import List, Tuple
+import math
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Tuple, Union
 
+from config import (
+    CORRUPTION_MODE_AWGN, CORRUPTION_MODE_BURST, CORRUPTION_MODE_GE, CORRUPTION_MODE_BSC,
+    GE_P_BAD_TO_GOOD, GE_ERROR_GOOD, GE_ERROR_BAD
+)
 
-def corrupt_with_xor(corrupted_bytes: bytearray, positions: List[int]) -> List[Tuple[int, int, int, int]]:
+# numpy, random and render are imported on first use to keep startup fast
+if TYPE_CHECKING:
+    import random
+    
+    import numpy as np
+
+
+class CorruptionLog(NamedTuple):
+    """
+    Array-backed change log: one entry per corrupted byte, stored as parallel
+    arrays rather than a tuple per change.
+    
+    Iterating zip(*log) yields the same (position, original_value, delta,
+    new_value) rows as the tuple lists; delta is the XOR value or the noise.
+    """
+    positions: "np.ndarray"   # intp
+    original: "np.ndarray"    # uint8
+    delta: "np.ndarray"       # uint8 XOR values or float64 noise
+    new: "np.ndarray"         # uint8
+
+
+Changes = Union[List[Tuple], CorruptionLog]
+
+
+def _default_rng(rng: Optional["random.Random"]):
+    """rng, or the global random module when none is given."""
+    if rng is None:
+        import random
+        return random
+    return rng
+
+
+class GilbertElliott(NamedTuple):
+    """
+    Two-state Markov burst channel: transition probabilities per byte and the
+    probability that a byte is corrupted in each state.
+    """
+    p_good_to_bad: float
+    p_bad_to_good: float
+    error_good: float
+    error_bad: float
+    
+    @property
+    def stationary_bad(self) -> float:
+        """Long-run fraction of bytes sent in the bad state."""
+        total = self.p_good_to_bad + self.p_bad_to_good
+        return self.p_good_to_bad / total if total else 0.0
+    
+    @property
+    def error_rate(self) -> float:
+        """Long-run byte error probability."""
+        bad = self.stationary_bad
+        return (1 - bad) * self.error_good + bad * self.error_bad
+
+
+def gilbert_elliott_for(mean_errors: float, n: int, p_bad_to_good: float = GE_P_BAD_TO_GOOD,
+                        error_good: float = GE_ERROR_GOOD,
+                        error_bad: float = GE_ERROR_BAD) -> GilbertElliott:
+    """
+    Gilbert-Elliott parameters averaging mean_errors corrupted bytes per
+    n-byte codeword.
+    
+    The burst shape (bad-state dwell and per-state error rates) is fixed and
+    the good-to-bad rate is solved from the stationary bad-state fraction.
+    Means beyond what that shape can produce saturate at p_good_to_bad = 1.
+    """
+    rate = mean_errors / n if n else 0.0
+    bad = (rate - error_good) / (error_bad - error_good)
+    bad = min(max(bad, 0.0), 1.0)
+    p_good_to_bad = 1.0 if bad >= 1.0 else min(1.0, bad * p_bad_to_good / (1.0 - bad))
+    return GilbertElliott(p_good_to_bad, p_bad_to_good, error_good, error_bad)
+
+
+def burst_positions(n: int, length: int, rng: Optional["random.Random"] = None) -> List[int]:
+    """
+    Positions of one burst of consecutive bytes at a random offset.
+    
+    Args:
+        n: Codeword length
+        length: Burst length in bytes (at most n)
+        rng: Random source (defaults to the global random module)
+    """
+    rng = _default_rng(rng)
+    start = rng.randint(0, n - length)
+    return list(range(start, start + length))
+
+
+def gilbert_elliott_positions(n: int, channel: GilbertElliott,
+                              rng: Optional["random.Random"] = None) -> List[int]:
+    """
+    Corrupted positions of an n-byte codeword sent over a Gilbert-Elliott channel.
+    
+    The state chain starts from its stationary distribution, so every byte
+    position is equally likely to be hit.
+    
+    Args:
+        n: Codeword length
+        channel: Channel parameters
+        rng: Random source (defaults to the global random module)
+    """
+    rng = _default_rng(rng)
+    bad = rng.random() < channel.stationary_bad
+    positions = []
+    for pos in range(n):
+        if rng.random() < (channel.error_bad if bad else channel.error_good):
+            positions.append(pos)
+        if bad:
+            bad = rng.random() >= channel.p_bad_to_good
+        else:
+            bad = rng.random() < channel.p_good_to_bad
+    return positions
+
+
+def iter_changes(changes: Changes) -> Iterable[Tuple]:
+    """Iterate (position, original_value, delta, new_value) rows of either log form."""
+    if isinstance(changes, CorruptionLog):
+        return zip(*changes)
+    return changes
+
+
+def corrupt_with_xor(corrupted_bytes: bytearray, positions: List[int],
+                     rng: Optional["random.Random"] = None) -> List[Tuple[int, int, int, int]]:
     """
     Corrupt bytes using random XOR flips.
     
     Args:
         corrupted_bytes: The bytearray to corrupt (modified in place)
         positions: List of positions to corrupt
+        rng: Random source (defaults to the global random module)
         
     Returns:
         List of tuples (position, original_value, xor_value, new_value)
     """
+    rng = _default_rng(rng)
     changes = []
     for pos in positions:
         original_value = corrupted_bytes[pos]
-        xor_val = random.randint(1, 255)  # non-zero to guarantee change
+        xor_val = rng.randint(1, 255)  # non-zero to guarantee change
         corrupted_bytes[pos] ^= xor_val
         new_value = corrupted_bytes[pos]
         changes.append((pos, original_value, xor_val, new_value))
@@ -25,7 +152,7 @@ def corrupt_with_xor(corrupted_bytes: bytearray, positions: List[int]) -> List[T
 
 
 def corrupt_with_awgn(corrupted_bytes: bytearray, positions: List[int], 
-                      sigma: float) -> List[Tuple[int, int, float, int]]:
+                      sigma: float, rng: Optional["random.Random"] = None) -> List[Tuple[int, int, float, int]]:
     """
     Corrupt bytes using AWGN-like (Additive White Gaussian Noise) model.
     
@@ -33,14 +160,16 @@ def corrupt_with_awgn(corrupted_bytes: bytearray, positions: List[int],
         corrupted_bytes: The bytearray to corrupt (modified in place)
         positions: List of positions to corrupt
         sigma: Standard deviation of the Gaussian noise
+        rng: Random source (defaults to the global random module)
         
     Returns:
         List of tuples (position, original_value, noise, new_value)
     """
+    rng = _default_rng(rng)
     changes = []
     for pos in positions:
         original_value = corrupted_bytes[pos]
-        noise = random.gauss(0.0, sigma)
+        noise = rng.gauss(0.0, sigma)
         noisy_val = int(round(original_value + noise))
         noisy_val = max(0, min(255, noisy_val))  # Clip to byte range
         corrupted_bytes[pos] = noisy_val
@@ -48,54 +177,209 @@ def corrupt_with_awgn(corrupted_bytes: bytearray, positions: List[int],
     return changes
 
 
+def bsc_bit_flips(n_bits: int, bit_error_rate: float,
+                  rng: Optional["random.Random"] = None) -> List[int]:
+    """
+    Flipped bit indices of an n_bits-long transmission over a binary
+    symmetric channel.
+    
+    Instead of one random draw per bit, the gap to the next flip is drawn
+    from the geometric distribution by inversion, so the cost is
+    proportional to the number of flips rather than the number of bits.
+    
+    Args:
+        n_bits: Number of transmitted bits
+        bit_error_rate: Probability that each bit is flipped
+        rng: Random source (defaults to the global random module)
+    
+    Returns:
+        Sorted list of flipped bit indices
+    """
+    if bit_error_rate <= 0:
+        return []
+    if bit_error_rate >= 1:
+        return list(range(n_bits))
+    rng = _default_rng(rng)
+    log_keep = math.log1p(-bit_error_rate)
+    flips = []
+    bit = -1
+    while True:
+        bit += 1 + int(math.log(1.0 - rng.random()) / log_keep)
+        if bit >= n_bits:
+            return flips
+        flips.append(bit)
+
+
+def corrupt_with_bsc(corrupted_bytes: bytearray, bit_error_rate: float,
+                     rng: Optional["random.Random"] = None) -> List[Tuple[int, int, int, int]]:
+    """
+    Corrupt bytes by flipping each bit independently (bit 0 is the MSB of byte 0).
+    
+    Args:
+        corrupted_bytes: The bytearray to corrupt (modified in place)
+        bit_error_rate: Probability that each bit is flipped
+        rng: Random source (defaults to the global random module)
+    
+    Returns:
+        List of tuples (position, original_value, xor_value, new_value), one
+        per byte with at least one flipped bit
+    """
+    masks = {}
+    for bit in bsc_bit_flips(len(corrupted_bytes) * 8, bit_error_rate, rng):
+        masks[bit >> 3] = masks.get(bit >> 3, 0) | (0x80 >> (bit & 7))
+    changes = []
+    for pos, xor_val in masks.items():
+        original_value = corrupted_bytes[pos]
+        corrupted_bytes[pos] ^= xor_val
+        changes.append((pos, original_value, xor_val, corrupted_bytes[pos]))
+    return changes
+
+
+def awgn_confidence(corrupted_bytes: bytes, changes: Changes) -> List[float]:
+    """
+    Per-byte reliability of the hard decisions made on an AWGN channel.
+    
+    A received value r is sliced to the nearest byte h; the decision is least
+    trustworthy when r lies halfway between two bytes and most trustworthy when
+    r sits on a byte value (or was clipped from beyond the byte range).
+    
+    Args:
+        corrupted_bytes: Hard-decision codeword
+        changes: AWGN change tuples (position, original_value, noise, new_value)
+            as returned by corrupt_with_awgn(), or a CorruptionLog
+    
+    Returns:
+        Confidence in [0, 1] for every byte of the codeword
+    """
+    confidence = [1.0] * len(corrupted_bytes)
+    for pos, orig, noise, _ in iter_changes(changes):
+        received = float(orig) + float(noise)
+        if -0.5 < received < 255.5:
+            confidence[pos] = 1.0 - 2.0 * abs(received - round(received))
+    return confidence
+
+
+def corruption_log(corrupted_bytes: bytearray, positions: List[int], mode: str,
+                   noise_sigma: float = None,
+                   rng: Optional["random.Random"] = None) -> CorruptionLog:
+    """
+    Corrupt bytes like corrupt_with_xor()/corrupt_with_awgn(), recording the
+    changes in a CorruptionLog instead of a list of tuples.
+    
+    Random values are drawn in the same order as the tuple versions, so a
+    given seed produces the same corruption either way.
+    
+    Args:
+        corrupted_bytes: The bytearray to corrupt (modified in place)
+        positions: List of positions to corrupt
+        mode: Corruption mode ('2' for AWGN, any other mode XORs)
+        noise_sigma: Standard deviation for AWGN mode
+        rng: Random source (defaults to the global random module)
+    
+    Returns:
+        CorruptionLog of the changes
+    """
+    import numpy as np
+    
+    rng = _default_rng(rng)
+    view = np.frombuffer(corrupted_bytes, dtype=np.uint8)
+    positions = np.asarray(positions, dtype=np.intp)
+    original = view[positions].copy()
+    if mode == CORRUPTION_MODE_AWGN:
+        delta = np.array([rng.gauss(0.0, noise_sigma) for _ in range(len(positions))], dtype=np.float64)
+        view[positions] = np.clip(np.rint(original + delta), 0, 255).astype(np.uint8)
+    else:
+        delta = np.array([rng.randint(1, 255) for _ in range(len(positions))], dtype=np.uint8)
+        view[positions] = original ^ delta
+    new = view[positions].copy()
+    del view  # release the export so the bytearray can be resized again
+    return CorruptionLog(positions, original, delta, new)
+
+
 def apply_corruption(encoded_bytes: bytes, n_errors: int, mode: str, 
-                    noise_sigma: float = None) -> Tuple[bytearray, List[int], List]:
+                    noise_sigma: float = None,
+                    rng: Optional["random.Random"] = None,
+                    compact: bool = False,
+                    bit_error_rate: float = None) -> Tuple[bytearray, List[int], Changes]:
     """
     Apply corruption to encoded bytes.
     
+    The burst and Gilbert-Elliott modes pick their positions from the
+    channel model and corrupt them with random XOR values.
+    
     Args:
         encoded_bytes: The encoded codeword
-        n_errors: Number of bytes to corrupt
-        mode: Corruption mode ('1' for XOR, '2' for AWGN)
+        n_errors: Number of bytes to corrupt (the burst length in burst mode,
+            the average count in Gilbert-Elliott mode, unused in BSC mode)
+        mode: Corruption mode ('1' XOR, '2' AWGN, '3' burst, '4' Gilbert-Elliott,
+            '5' binary symmetric channel)
         noise_sigma: Standard deviation for AWGN mode
+        rng: Random source (defaults to the global random module); pass a
+            seeded random.Random for an independent, reproducible stream
+        compact: Return the changes as a CorruptionLog of arrays instead of
+            a list of tuples (much smaller for large runs)
+        bit_error_rate: Bit flip probability for BSC mode
         
     Returns:
         Tuple of (corrupted_bytes, corruption_positions, changes)
     """
     corrupted_bytes = bytearray(encoded_bytes)
     
+    if mode == CORRUPTION_MODE_BSC:
+        changes = corrupt_with_bsc(corrupted_bytes, bit_error_rate, rng)
+        corruption_positions = [pos for pos, _, _, _ in changes]
+        if compact:
+            import numpy as np
+            
+            columns = list(zip(*changes)) or [(), (), (), ()]
+            changes = CorruptionLog(*(np.array(column, dtype=dtype) for column, dtype
+                                      in zip(columns, (np.intp, np.uint8, np.uint8, np.uint8))))
+        return corrupted_bytes, corruption_positions, changes
+    
     if n_errors == 0:
+        if compact:
+            return corrupted_bytes, [], corruption_log(corrupted_bytes, [], mode, noise_sigma, rng)
         return corrupted_bytes, [], []
     
-    # Choose random distinct positions to corrupt
-    corruption_positions = random.sample(range(len(corrupted_bytes)), n_errors)
-    corruption_positions.sort()
+    rng = _default_rng(rng)
+    if mode == CORRUPTION_MODE_BURST:
+        corruption_positions = burst_positions(len(corrupted_bytes), n_errors, rng)
+    elif mode == CORRUPTION_MODE_GE:
+        channel = gilbert_elliott_for(n_errors, len(corrupted_bytes))
+        corruption_positions = gilbert_elliott_positions(len(corrupted_bytes), channel, rng)
+    else:
+        # Choose random distinct positions to corrupt
+        corruption_positions = rng.sample(range(len(corrupted_bytes)), n_errors)
+        corruption_positions.sort()
     
-    if mode == "1":
-        changes = corrupt_with_xor(corrupted_bytes, corruption_positions)
-    else:  # mode == "2"
-        changes = corrupt_with_awgn(corrupted_bytes, corruption_positions, noise_sigma)
+    if compact:
+        changes = corruption_log(corrupted_bytes, corruption_positions, mode, noise_sigma, rng)
+    elif mode == CORRUPTION_MODE_AWGN:
+        changes = corrupt_with_awgn(corrupted_bytes, corruption_positions, noise_sigma, rng)
+    else:
+        changes = corrupt_with_xor(corrupted_bytes, corruption_positions, rng)
     
     return corrupted_bytes, corruption_positions, changes
 
 
-def print_corruption_changes(changes: List, mode: str, noise_sigma: float = None):
+def print_corruption_changes(changes: Changes, mode: str, noise_sigma: float = None):
     """
     Print the corruption changes in a formatted way.
     
     Args:
-        changes: List of change tuples from corruption functions
-        mode: Corruption mode ('1' for XOR, '2' for AWGN)
+        changes: List of change tuples from corruption functions, or a
+            CorruptionLog
+        mode: Corruption mode ('2' for AWGN, any other mode XORs)
         noise_sigma: Standard deviation for AWGN mode (for display)
     """
-    print("Byte changes (original → corrupted):")
+    from render import elide_lines, write_lines
     
-    if mode == "1":
-        # XOR mode: (position, original_value, xor_value, new_value)
-        for pos, orig, xor_val, new_val in changes:
-            print(f"  position {pos:3d}: {orig:3d}  XOR {xor_val:3d}  →  {new_val:3d}")
-    else:
+    if mode == CORRUPTION_MODE_AWGN:
         # AWGN mode: (position, original_value, noise, new_value)
-        for pos, orig, noise, new_val in changes:
-            print(f"  position {pos:3d}: {orig:3d}  + N(0,{noise_sigma})  →  {new_val:3d}")
-    print()
+        lines = [f"  position {pos:3d}: {orig:3d}  + N(0,{noise_sigma})  →  {new_val:3d}"
+                 for pos, orig, noise, new_val in iter_changes(changes)]
+    else:
+        # XOR-based modes: (position, original_value, xor_value, new_value)
+        lines = [f"  position {pos:3d}: {orig:3d}  XOR {xor_val:3d}  →  {new_val:3d}"
+                 for pos, orig, xor_val, new_val in iter_changes(changes)]
+    write_lines(["Byte changes (original → corrupted):", *elide_lines(lines), ""])
@@ -0,0 +1,111 @@
+"""Table-driven GF(2^8) arithmetic used by the in-project Reed-Solomon engine."""
+
+from typing import List, Sequence
+
+from config import GF_PRIM
+
+# Same field as reedsolo's defaults, so codewords are interchangeable
+PRIM = GF_PRIM
+FIELD_SIZE = 256
+FIELD_ORDER = 255  # number of non-zero elements
+
+
+def _build_tables():
+    """
+    Build the log/antilog tables and the full 256x256 multiplication table.
+
+    Returns:
+        Tuple of (exp_table, log_table, mul_table)
+        - exp_table: 512 entries so exp[log a + log b] never needs a modulo
+        - log_table: log[0] is unused
+        - mul_table: mul[a][b] == a * b in GF(2^8), one bytes row per a
+    """
+    exp_table = [0] * (FIELD_ORDER * 2 + 2)
+    log_table = [0] * FIELD_SIZE
+    x = 1
+    for i in range(FIELD_ORDER):
+        exp_table[i] = x
+        log_table[x] = i
+        x <<= 1
+        if x & 0x100:
+            x ^= PRIM
+    for i in range(FIELD_ORDER, len(exp_table)):
+        exp_table[i] = exp_table[i - FIELD_ORDER]
+
+    mul_table = [bytes(FIELD_SIZE)]
+    for a in range(1, FIELD_SIZE):
+        log_a = log_table[a]
+        mul_table.append(bytes([0] + [exp_table[log_a + log_table[b]] for b in range(1, FIELD_SIZE)]))
+    return exp_table, log_table, mul_table
+
+
+# Built once at import; every codec instance shares these
+GF_EXP, GF_LOG, GF_MUL = _build_tables()
+
+
+def gf_mul(a: int, b: int) -> int:
+    """Multiply two field elements."""
+    return GF_MUL[a][b]
+
+
+def gf_div(a: int, b: int) -> int:
+    """Divide a by b (b must be non-zero)."""
+    if b == 0:
+        raise ZeroDivisionError("division by zero in GF(2^8)")
+    if a == 0:
+        return 0
+    return GF_EXP[GF_LOG[a] + FIELD_ORDER - GF_LOG[b]]
+
+
+def gf_inverse(a: int) -> int:
+    """Multiplicative inverse of a non-zero field element."""
+    return gf_div(1, a)
+
+
+def gf_pow(a: int, power: int) -> int:
+    """Raise a field element to an integer (possibly negative) power."""
+    if a == 0:
+        return 1 if power == 0 else 0
+    return GF_EXP[(GF_LOG[a] * power) % FIELD_ORDER]
+
+
+def gf_poly_mul(p: Sequence[int], q: Sequence[int]) -> List[int]:
+    """
+    Multiply two polynomials.
+
+    Both operands and the result use the same coefficient order.
+    """
+    result = [0] * (len(p) + len(q) - 1)
+    for i, coef in enumerate(p):
+        if coef:
+            row = GF_MUL[coef]
+            for j, other in enumerate(q):
+                result[i + j] ^= row[other]
+    return result
+
+
+def gf_poly_eval(poly: Sequence[int], x: int) -> int:
+    """Evaluate a polynomial (highest degree first) at x using Horner's rule."""
+    row = GF_MUL[x]
+    y = 0
+    for coef in poly:
+        y = row[y] ^ coef
+    return y
+
+
+def rs_generator_poly(nsym: int, fcr: int = 0, generator: int = 2) -> List[int]:
+    """
+    Build the Reed-Solomon generator polynomial (highest degree first).
+
+    Args:
+        nsym: Number of parity symbols
+        fcr: First consecutive root exponent
+        generator: Primitive element whose powers are the roots
+
+    Returns:
+        The monic polynomial prod(x - generator^(fcr + i)) for i < nsym
+    """
+    g = [1]
+    for i in range(nsym):
+        g = gf_poly_mul(g, [1, gf_pow(generator, i + fcr)])
+    return g
@@ -0,0 +1,152 @@
+"""
+Importance-sampling estimates of very low frame error rates.
+
+On a channel that corrupts each codeword byte independently with probability
+p, decoding only fails once more than n_parity // 2 bytes are hit, which for
+small p is far too rare to observe directly. Trials therefore draw their
+error count from a binomial biased toward that boundary, corrupt that many
+uniformly chosen bytes, decode for real, and weight each failure by the
+likelihood ratio of its error count under the true and the biased channel.
+
+Usage:
+    python importance_sampling.py [trials]
+"""
+
+import math
+import sys
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from analytic import code_for_level, error_rates
+from batch_corruption import corrupt_batch_counts
+from config import ERROR_CORRECTION_LEVELS, SIM_BATCH_SIZE, SIM_CONFIDENCE_Z
+from reed_solomon_codec import ReedSolomonEncoder
+
+
+class ImportanceResult(NamedTuple):
+    """Weighted frame error rate estimate for one level and symbol error rate."""
+    level: str
+    symbol_error_rate: float
+    bias_rate: float        # per-byte error probability trials were drawn with
+    trials: int
+    fer: float
+    std_error: float
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error relative to the estimate (inf before any failure)."""
+        return self.std_error / self.fer if self.fer else math.inf
+
+    @property
+    def fer_interval(self) -> Tuple[float, float]:
+        """Normal-approximation confidence interval of the estimate."""
+        half = SIM_CONFIDENCE_Z * self.std_error
+        return max(0.0, self.fer - half), self.fer + half
+
+
+def binomial_log_pmf(n: int, k: np.ndarray, p: float) -> np.ndarray:
+    """Log of the Binomial(n, p) probability of each count in k."""
+    k = np.asarray(k, dtype=np.float64)
+    log_choose = (math.lgamma(n + 1)
+                  - np.vectorize(math.lgamma)(k + 1) - np.vectorize(math.lgamma)(n - k + 1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_p = np.where(k > 0, k * math.log(p) if p > 0 else -np.inf, 0.0)
+        log_q = np.where(k < n, (n - k) * math.log1p(-p) if p < 1 else -np.inf, 0.0)
+    return log_choose + log_p + log_q
+
+
+def exact_fer(level: str, symbol_error_rate: float, message_len: Optional[int] = None) -> float:
+    """
+    Frame error rate of a bounded-distance decoder on the independent
+    symbol error channel: P(more than n_parity // 2 of n bytes in error).
+    """
+    n, k = code_for_level(level, message_len)
+    fer, _ = error_rates(n, k, symbol_error_rate)
+    return fer
+
+
+def importance_sample(level: str, symbol_error_rate: float, trials: int,
+                      seed: Optional[int] = None, bias_rate: Optional[float] = None,
+                      message_len: Optional[int] = None,
+                      batch_size: int = SIM_BATCH_SIZE) -> ImportanceResult:
+    """
+    Estimate the FER of a level on the independent symbol error channel.
+
+    Args:
+        level: Error correction level from ERROR_CORRECTION_LEVELS
+        symbol_error_rate: Probability that each codeword byte is corrupted
+        trials: Codewords to simulate
+        seed: Seed for reproducible runs
+        bias_rate: Per-byte error probability to sample with (defaults to
+            (n_parity // 2 + 1) / n, centring the error count on the first
+            uncorrectable one)
+        message_len: Data bytes per codeword (defaults to a full block)
+        batch_size: Codewords per vectorized encode/decode
+
+    Returns:
+        ImportanceResult with the weighted estimate and its standard error
+    """
+    n_parity = ERROR_CORRECTION_LEVELS[level]
+    k = message_len or 255 - n_parity
+    n = k + n_parity
+    bias_rate = bias_rate or (n_parity // 2 + 1) / n
+    encoder = ReedSolomonEncoder(n_parity)
+    rng = np.random.default_rng(seed)
+
+    # Likelihood ratio of every possible error count
+    counts = np.arange(n + 1)
+    weights = np.exp(binomial_log_pmf(n, counts, symbol_error_rate)
+                     - binomial_log_pmf(n, counts, bias_rate))
+
+    total = total_sq = 0.0
+    done = 0
+    while done < trials:
+        batch = min(batch_size, trials - done)
+        messages = rng.integers(0, 256, size=(batch, k), dtype=np.uint8)
+        codewords = encoder.encode_batch(messages)
+        n_errors = rng.binomial(n, bias_rate, size=batch)
+        corrupt_batch_counts(codewords, n_errors, rng)
+
+        result = encoder.decode_batch(codewords)
+        failed = ~result.success | (result.data != messages).any(axis=1)
+        weighted = np.where(failed, weights[n_errors], 0.0)
+        total += float(weighted.sum())
+        total_sq += float(np.square(weighted).sum())
+        done += batch
+
+    fer = total / trials
+    variance = max(total_sq / trials - fer * fer, 0.0) * trials / max(trials - 1, 1)
+    return ImportanceResult(level, symbol_error_rate, bias_rate, trials, fer,
+                            math.sqrt(variance / trials))
+
+
+def compare_with_exact(level: str, symbol_error_rates: Iterable[float], trials: int,
+                       seed: Optional[int] = None) -> List[Tuple[ImportanceResult, float]]:
+    """Importance-sampling estimates paired with the exact binomial FER."""
+    return [
+        (importance_sample(level, rate, trials, seed), exact_fer(level, rate))
+        for rate in symbol_error_rates
+    ]
+
+
+def format_comparison(rows: List[Tuple[ImportanceResult, float]]) -> str:
+    """Render compare_with_exact() output as a text table."""
+    lines = [f"{'Level':<6}{'p_symbol':>10}{'Trials':>9}{'IS FER':>12}{'rel err':>9}{'Exact FER':>12}{'IS/exact':>10}"]
+    for r, exact in rows:
+        ratio = r.fer / exact if exact else math.nan
+        lines.append(
+            f"{r.level:<6}{r.symbol_error_rate:>10.4g}{r.trials:>9}{r.fer:>12.3e}"
+            f"{r.relative_error:>9.2%}{exact:>12.3e}{ratio:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Check the estimator against the exact FER down to about 1e-12 at level H."""
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    print(format_comparison(compare_with_exact("H", (0.02, 0.01, 0.0065), trials, seed=0)))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,25 @@ The code is organized into separate modules for better maintainability:
 - reed_solomon_codec.py: Encoding and decoding logic
 - corruption.py: Corruption simulation (XOR and AWGN)
 - ui_utils.py: Display and animation utilities
+
+Animations and the step-by-step explanations are shown only when stdout is a
+terminal; use --quiet, --no-animation or --verbose to override:
+
+    printf 'hello\nH\n3\n1\n' | python main.py --quiet
 """
 
-from config import ERROR_CORRECTION_LEVELS, CORRUPTION_MODE_XOR, CORRUPTION_MODE_AWGN
-from reed_solomon_codec import ReedSolomonEncoder
-from corruption import apply_corruption, print_corruption_changes
-from ui_utils import (
-    animate, print_header, print_section, print_ec_levels,
-    print_encoding_info, print_corruption_info, print_decoding_concept,
-    print_summary
+from typing import TYPE_CHECKING, List, Optional
+
+from config import (
+    ERROR_CORRECTION_LEVELS, CORRUPTION_MODE_XOR, CORRUPTION_MODE_AWGN,
+    CORRUPTION_MODE_BURST, CORRUPTION_MODE_GE
 )
 
+# The codec, corruption, UI and argument parsing modules are imported by the
+# functions that use them, so `import main` stays cheap (startup_benchmark.py)
+if TYPE_CHECKING:
+    import argparse
+
 
 def get_user_message() -> str:
     """Get the message from the user."""
@@ -31,6 +39,8 @@ def get_error_correction_level() -> tuple[str, int]:
     Returns:
         Tuple of (level_name, n_parity_bytes)
     """
+    from ui_utils import print_ec_levels
+    
     print_ec_levels()
     
     while True:
@@ -69,13 +79,16 @@ def get_corruption_parameters(max_bytes: int, max_correctable: int) -> tuple[int
     print("Choose corruption model:")
     print("  1 → Random byte flips (XOR)  [discrete, like random bit errors]")
     print("  2 → AWGN-like noise          [add Gaussian noise to byte values]")
+    print("  3 → Burst errors             [that many consecutive bytes]")
+    print("  4 → Gilbert–Elliott channel  [bursty errors, that many on average]")
     
     # Get corruption mode
+    modes = (CORRUPTION_MODE_XOR, CORRUPTION_MODE_AWGN, CORRUPTION_MODE_BURST, CORRUPTION_MODE_GE)
     while True:
-        mode = input("Enter 1 or 2: ").strip()
-        if mode in (CORRUPTION_MODE_XOR, CORRUPTION_MODE_AWGN):
+        mode = input("Enter 1, 2, 3 or 4: ").strip()
+        if mode in modes:
             break
-        print("Please enter 1 or 2.")
+        print("Please enter 1, 2, 3 or 4.")
     
     # Get noise sigma if AWGN mode
     noise_sigma = None
@@ -92,8 +105,38 @@ def get_corruption_parameters(max_bytes: int, max_correctable: int) -> tuple[int
     return n_errors, mode, noise_sigma
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> "argparse.Namespace":
+    """Parse the presentation flags."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Interactive Reed-Solomon error correction demo")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="no animation and no step-by-step explanations")
+    parser.add_argument("--no-animation", action="store_true", help="disable the dot animations")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print the explanations even when output is not a terminal")
+    parser.add_argument("--hexdump", action="store_true",
+                        help="page through a full hexdump of the corrupted codeword")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main function orchestrating the Reed-Solomon demo."""
+    from corruption import apply_corruption, print_corruption_changes
+    from reed_solomon_codec import ReedSolomonEncoder
+    from render import summarize
+    from ui_utils import (
+        animating, configure_presentation, verbose_enabled, print_header, print_section,
+        print_encoding_info, print_corruption_info, print_decoding_concept,
+        print_hexdump, print_summary
+    )
+    
+    args = parse_args(argv)
+    configure_presentation(
+        animations=False if args.quiet or args.no_animation else None,
+        verbose=False if args.quiet else (True if args.verbose else None),
+    )
+
     print_header("Reed-Solomon Error Correction Demo (QR-Style, Text Only)")
     
     # ========================================================================
@@ -123,8 +166,11 @@ def main():
     # ========================================================================
     print_section("STEP 2: Adding Reed-Solomon error correction")
     
-    animate("Building Reed–Solomon encoder")
-    animate("Generating parity bytes")
+    # The parity was computed above; these only narrate it, without sleeping
+    with animating("Building Reed–Solomon encoder"):
+        pass
+    with animating("Generating parity bytes"):
+        pass
     print()
     
     # ========================================================================
@@ -142,11 +188,15 @@ def main():
         encoded_bytes, n_errors, mode, noise_sigma
     )
     
-    if n_errors > 0:
-        print(f"Corrupting {n_errors} byte(s) at positions: {corruption_positions}")
+    if n_errors > 0 and verbose_enabled():
+        print(f"Corrupting {n_errors} byte(s) at positions: {summarize(corruption_positions)}")
         print_corruption_changes(changes, mode, noise_sigma)
     
     print_corruption_info(encoded_bytes, corrupted_bytes, corruption_positions, mode, noise_sigma)
+    if args.hexdump:
+        print("Received codeword (corrupted bytes in brackets):")
+        print_hexdump(corrupted_bytes, corruption_positions)
+        print()
     
     # ========================================================================
     # STEP 6: Attempt to decode and correct errors
@@ -155,10 +205,8 @@ def main():
     
     print_decoding_concept()
     
-    animate("Computing syndromes")
-    animate("Locating and correcting errors")
-    
-    success, decoded_message, decoded_bytes = encoder.decode(corrupted_bytes)
+    with animating("Computing syndromes, locating and correcting errors"):
+        success, decoded_message, decoded_bytes = encoder.decode(corrupted_bytes)
     
     if success:
         # Count how many bytes were actually different from the original codeword
@@ -169,7 +217,7 @@ def main():
         
         print("✓ Decoding successful!")
         print()
-        print(f"Bytes that were corrupted (positions): {corruption_positions}")
+        print(f"Bytes that were corrupted (positions): {summarize(corruption_positions)}")
         print(f"Number of bytes actually changed:      {num_introduced_errors}")
         print()
         print(f"Decoded message: '{decoded_message}'")
@@ -1,22 +1,45 @@
 """Reed-Solomon encoding and decoding functionality."""
 
-from reedsolo import RSCodec, ReedSolomonError
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, List, Sequence, Tuple, Optional
+
+from codec_registry import decode_errors, get_codec
+from config import CODEC_BACKEND_TABLE, DEFAULT_CODEC_BACKEND
+
+# NumPy, the batch kernels and the table codec are imported on first use so
+# that importing this module (and main.py) stays fast
+if TYPE_CHECKING:
+    import numpy as np
+    from batch_codec import BatchDecodeResult, ErasureBatch, MessageBatch
+    from soft_decoding import SoftDecodeResult
+    from table_codec import TableRSCodec
 
 
 class ReedSolomonEncoder:
     """Handles Reed-Solomon encoding and decoding operations."""
     
-    def __init__(self, n_parity: int):
+    def __init__(self, n_parity: int, backend: str = DEFAULT_CODEC_BACKEND):
         """
         Initialize the Reed-Solomon codec.
         
+        Codec instances come from the process-wide registry, so creating many
+        encoders for the same level is cheap.
+        
         Args:
             n_parity: Number of parity bytes for error correction
+            backend: Codec backend ('reedsolo' or 'table')
         """
         self.n_parity = n_parity
-        self.rs = RSCodec(n_parity)
+        self.backend = backend
+        self.rs = get_codec(n_parity, backend=backend)
         self.max_correctable = n_parity // 2
+        self._table_codec = None
+    
+    @property
+    def table_codec(self) -> "TableRSCodec":
+        """Table-driven codec used by the vectorized batch paths (any backend)."""
+        if self._table_codec is None:
+            self._table_codec = get_codec(self.n_parity, backend=CODEC_BACKEND_TABLE)
+        return self._table_codec
     
     def encode(self, message: str) -> Tuple[bytes, bytes]:
         """
@@ -32,12 +55,48 @@ class ReedSolomonEncoder:
         encoded_bytes = self.rs.encode(message_bytes)
         return message_bytes, encoded_bytes
     
-    def decode(self, corrupted_bytes: bytes) -> Tuple[bool, Optional[str], Optional[bytes]]:
+    def encode_batch(self, messages: "MessageBatch") -> "np.ndarray":
+        """
+        Encode many single-block messages in one vectorized pass.
+        
+        Args:
+            messages: List of str/bytes messages or a 2-D uint8 array, one
+                message per row. Shorter messages are left-padded with zeros.
+            
+        Returns:
+            Contiguous (batch, length + n_parity) uint8 array of codewords
+        """
+        from batch_codec import encode_batch
+        
+        return encode_batch(self.table_codec, messages)
+    
+    def decode_batch(self, codewords: "MessageBatch",
+                     erasures: Optional["ErasureBatch"] = None) -> "BatchDecodeResult":
+        """
+        Decode many single-block codewords, correcting only the corrupted ones.
+        
+        Args:
+            codewords: 2-D uint8 array (repaired in place when writable) or a
+                list of equal-length codewords
+            erasures: Optional known-bad positions, either a (batch, n) bool
+                mask or one list of positions per row
+            
+        Returns:
+            BatchDecodeResult of (data, success, corrected); data is a view of
+            the codewords' data columns and corrected counts errata per row
+        """
+        from batch_codec import decode_batch
+        
+        return decode_batch(self.table_codec, codewords, erasures)
+    
+    def decode(self, corrupted_bytes: bytes,
+               erase_pos: Optional[List[int]] = None) -> Tuple[bool, Optional[str], Optional[bytes]]:
         """
         Decode a corrupted codeword using Reed-Solomon error correction.
         
         Args:
             corrupted_bytes: The potentially corrupted codeword
+            erase_pos: Optional known-bad (erased) positions in the codeword
             
         Returns:
             Tuple of (success, decoded_message, decoded_bytes)
@@ -46,7 +105,7 @@ class ReedSolomonEncoder:
             - decoded_bytes: The decoded bytes if successful, None otherwise
         """
         try:
-            decoded_result = self.rs.decode(bytes(corrupted_bytes))
+            decoded_result = self.rs.decode(bytes(corrupted_bytes), erase_pos=erase_pos)
             
             # Handle both possible return types (tuple or bytes)
             if isinstance(decoded_result, tuple):
@@ -57,9 +116,111 @@ class ReedSolomonEncoder:
             decoded_message = decoded_bytes.decode("utf-8")
             return True, decoded_message, decoded_bytes
             
-        except ReedSolomonError:
+        except decode_errors(self.backend):
             return False, None, None
     
+    def decode_errata(self, corrupted_bytes: bytes,
+                      erase_pos: Optional[List[int]] = None) -> Tuple[bool, Optional[bytes], int, int]:
+        """
+        Decode with known erasures and report how many errata were repaired.
+        
+        An erasure (a position known to be bad) costs one parity byte while an
+        unknown error costs two, so decoding succeeds while
+        2 * errors + erasures <= n_parity. At level H that is up to 32 erased
+        bytes instead of 16 blind errors.
+        
+        Args:
+            corrupted_bytes: The potentially corrupted codeword
+            erase_pos: Known-bad positions in the codeword
+            
+        Returns:
+            Tuple of (success, decoded_bytes, n_erasures, n_errors)
+            - decoded_bytes: The decoded bytes if successful, None otherwise
+            - n_erasures: Number of erased positions supplied
+            - n_errors: Number of additional error positions that were located
+        """
+        erase_pos = sorted(set(erase_pos or []))
+        try:
+            decoded_bytes, _, errata_pos = self.rs.decode(bytes(corrupted_bytes), erase_pos=erase_pos or None)
+        except decode_errors(self.backend):
+            return False, None, len(erase_pos), 0
+        n_errors = len(errata_pos) - len(erase_pos)
+        return True, bytes(decoded_bytes), len(erase_pos), n_errors
+    
+    def decode_soft(self, corrupted_bytes: bytes, confidence: Sequence[float]) -> "SoftDecodeResult":
+        """
+        Soft-decision decode using per-byte reliability information.
+        
+        The least reliable bytes are tried as erasures (generalized minimum
+        distance decoding), which corrects error patterns beyond
+        get_max_correctable() when the channel flags the bad bytes as
+        unreliable. See corruption.awgn_confidence() for AWGN channels.
+        
+        Args:
+            corrupted_bytes: The received (hard-decision) codeword
+            confidence: Reliability of each byte, higher is more reliable
+            
+        Returns:
+            SoftDecodeResult of (success, decoded_bytes, erasures, trials)
+        """
+        from soft_decoding import soft_decode
+        
+        return soft_decode(self.table_codec, corrupted_bytes, confidence)
+    
+    def encode_bytes(self, data, out=None) -> memoryview:
+        """
+        Encode arbitrary binary data without a UTF-8 round trip.
+        
+        Args:
+            data: Any buffer-protocol object (bytes, bytearray, memoryview,
+                mmap, numpy array, ...)
+            out: Optional writable buffer to encode into; must hold at least
+                encoded_size(len(data)) bytes. A new bytearray is used if None.
+            
+        Returns:
+            Memoryview of the encoded bytes inside out
+        """
+        from table_codec import byte_view
+        
+        codec = self.table_codec
+        if out is None:
+            out = bytearray(codec.encoded_size(byte_view(data).nbytes))
+        written = codec.encode_into(data, out)
+        return byte_view(out)[:written]
+    
+    def decode_bytes(self, codeword, out=None) -> Tuple[bool, Optional[memoryview]]:
+        """
+        Decode arbitrary binary codewords without a UTF-8 round trip.
+        
+        Args:
+            codeword: Any buffer-protocol object holding the codewords
+            out: Optional writable buffer for the decoded data; must hold at
+                least decoded_size(len(codeword)) bytes
+            
+        Returns:
+            Tuple of (success, decoded)
+            - success: True if decoding succeeded, False otherwise
+            - decoded: Memoryview of the decoded bytes inside out, None on failure
+        """
+        from table_codec import UncorrectableError, byte_view
+        
+        codec = self.table_codec
+        if out is None:
+            out = bytearray(codec.decoded_size(byte_view(codeword).nbytes))
+        try:
+            written, _ = codec.decode_into(codeword, out)
+        except UncorrectableError:
+            return False, None
+        return True, byte_view(out)[:written]
+    
+    def encoded_size(self, data_size: int) -> int:
+        """Number of codeword bytes produced for data_size message bytes."""
+        return self.table_codec.encoded_size(data_size)
+    
+    def decoded_size(self, codeword_size: int) -> int:
+        """Number of message bytes carried by codeword_size codeword bytes."""
+        return self.table_codec.decoded_size(codeword_size)
+    
     def get_max_correctable(self) -> int:
         """Get the maximum number of correctable byte errors."""
         return self.max_correctable
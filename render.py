@@ -0,0 +1,143 @@
+"""
+Size-bounded text rendering of byte arrays for the demo output.
+
+Codewords of long messages run to megabytes, and printing them as Python
+lists costs seconds of terminal time. The helpers here summarize long arrays
+(head and tail, or hex windows around the bytes that matter), build whole
+blocks of output as lists of lines and hand them to the terminal in a single
+write, and page through full hexdumps on request.
+"""
+
+import sys
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+from config import (
+    HEXDUMP_PAGE_LINES, HEXDUMP_WIDTH, RENDER_EDGE_ITEMS, RENDER_MAX_ITEMS,
+    RENDER_MAX_WINDOWS, RENDER_WINDOW_RADIUS
+)
+
+
+def write_lines(lines: Iterable[str], out=None):
+    """Write lines to out (stdout by default) with one write call and a flush."""
+    out = out or sys.stdout
+    out.write("".join(f"{line}\n" for line in lines))
+    out.flush()
+
+
+def elide_lines(lines: List[str], max_lines: int = RENDER_MAX_ITEMS,
+                edge: int = RENDER_EDGE_ITEMS, indent: str = "  ") -> List[str]:
+    """Keep the first and last edge lines of a long list, noting how many were dropped."""
+    if len(lines) <= max_lines:
+        return lines
+    hidden = len(lines) - 2 * edge
+    return lines[:edge] + [f"{indent}... {hidden} more line(s) ...", *lines[-edge:]]
+
+
+def summarize(values: Sequence[int], max_items: int = RENDER_MAX_ITEMS,
+              edge: int = RENDER_EDGE_ITEMS) -> str:
+    """
+    Render a byte/int sequence as a list, eliding the middle of long ones.
+
+    Sequences of up to max_items render exactly like list(values); longer ones
+    show the first and last edge items and the number left out.
+    """
+    if len(values) <= max_items:
+        return str([int(v) for v in values])
+    head = ", ".join(str(int(v)) for v in values[:edge])
+    tail = ", ".join(str(int(v)) for v in values[-edge:])
+    return f"[{head}, ... {len(values) - 2 * edge} more ..., {tail}] ({len(values)} items)"
+
+
+def summarize_text(text: str, max_chars: int = RENDER_MAX_ITEMS * 4) -> str:
+    """Shorten long text to its start and end."""
+    if len(text) <= max_chars:
+        return text
+    edge = max_chars // 2
+    return f"{text[:edge]}…[{len(text) - 2 * edge} more chars]…{text[-edge:]}"
+
+
+def hexdump_line(data: Sequence[int], offset: int, width: int = HEXDUMP_WIDTH,
+                 marked: Optional[set] = None) -> str:
+    """
+    One hexdump row: offset, hex bytes and printable ASCII.
+
+    Bytes whose position is in marked are bracketed.
+    """
+    row = data[offset:offset + width]
+    cells = []
+    for i, b in enumerate(row):
+        cell = f"{int(b):02x}"
+        cells.append(f"[{cell}]" if marked and offset + i in marked else f" {cell} ")
+    cells.extend("    " for _ in range(width - len(row)))
+    text = "".join(chr(b) if 32 <= b < 127 else "." for b in bytes(row))
+    return f"{offset:08x} {''.join(cells)} |{text}|"
+
+
+def hexdump(data: Sequence[int], marked: Iterable[int] = (), width: int = HEXDUMP_WIDTH,
+            start: int = 0, stop: Optional[int] = None) -> List[str]:
+    """Hexdump rows covering data[start:stop], rounded out to whole rows."""
+    marked = set(marked)
+    stop = len(data) if stop is None else min(stop, len(data))
+    first = start - start % width
+    return [hexdump_line(data, offset, width, marked) for offset in range(first, stop, width)]
+
+
+def hex_windows(original: Sequence[int], received: Sequence[int], positions: Iterable[int],
+                radius: int = RENDER_WINDOW_RADIUS, width: int = HEXDUMP_WIDTH,
+                max_windows: int = RENDER_MAX_WINDOWS) -> List[str]:
+    """
+    Side-by-side hexdump rows of two arrays around the given positions.
+
+    Each position's window spans radius bytes either side, widened to whole
+    rows; windows that touch or overlap are merged, so no row is printed
+    twice. Each window shows the original rows then the received rows with
+    changed bytes bracketed. At most max_windows windows are rendered.
+    """
+    positions = sorted(set(int(p) for p in positions))
+    windows: List[List[int]] = []
+    for pos in positions:
+        low = max(pos - radius, 0) // width * width
+        high = min(-(-(pos + radius + 1) // width) * width, len(received))
+        if windows and low <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], high)
+        else:
+            windows.append([low, high])
+
+    lines = []
+    for low, high in windows[:max_windows]:
+        marked = [p for p in positions if low <= p < high]
+        lines.append(f"  bytes {low} .. {high - 1}:")
+        lines.extend(f"    sent {row}" for row in hexdump(original, marked, width, low, high))
+        lines.extend(f"    recv {row}" for row in hexdump(received, marked, width, low, high))
+    if len(windows) > max_windows:
+        lines.append(f"  ... {len(windows) - max_windows} more window(s) ...")
+    return lines
+
+
+def hexdump_pages(data: Sequence[int], marked: Iterable[int] = (),
+                  page_lines: int = HEXDUMP_PAGE_LINES,
+                  width: int = HEXDUMP_WIDTH) -> Iterator[List[str]]:
+    """Yield the full hexdump of data one page of rows at a time."""
+    marked = set(marked)
+    page_bytes = page_lines * width
+    for start in range(0, len(data), page_bytes):
+        yield hexdump(data, marked, width, start, start + page_bytes)
+
+
+def page_hexdump(data: Sequence[int], marked: Iterable[int] = (),
+                 page_lines: int = HEXDUMP_PAGE_LINES,
+                 prompt: Callable[[str], str] = input, out=None):
+    """
+    Show a full hexdump one page (one write) at a time.
+
+    On a terminal the user presses Enter for the next page or q to stop;
+    otherwise every page is written without prompting.
+    """
+    out = out or sys.stdout
+    interactive = getattr(out, "isatty", lambda: False)()
+    pages = hexdump_pages(data, marked, page_lines)
+    for number, lines in enumerate(pages, 1):
+        write_lines(lines, out)
+        if interactive and number * page_lines * HEXDUMP_WIDTH < len(data):
+            if prompt(f"-- page {number}: Enter for more, q to stop -- ").strip().lower() == "q":
+                break
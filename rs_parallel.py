@@ -0,0 +1,186 @@
+"""Multiprocess Reed-Solomon encoding/decoding of large buffers via shared memory."""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from batch_codec import decode_batch, encode_batch
+from config import PARALLEL_SHARDS_PER_WORKER, STREAM_CHUNK_BLOCKS
+from rs_stream import _decode_blocks, stream_codec
+from table_codec import byte_view
+
+
+class ParallelDecodeResult(NamedTuple):
+    """Outcome of parallel_decode()."""
+    data: bytearray
+    corrected: int      # corrected byte positions over all blocks
+    failed_blocks: int  # blocks copied through unrepaired
+
+
+def _shards(n_blocks: int, n_shards: int) -> List[Tuple[int, int]]:
+    """Split block indices [0, n_blocks) into at most n_shards contiguous ranges."""
+    if n_blocks == 0:
+        return []
+    n_shards = max(1, min(n_shards, n_blocks))
+    step = -(-n_blocks // n_shards)
+    return [(first, min(first + step, n_blocks)) for first in range(0, n_blocks, step)]
+
+
+def _encode_shard(level: str, in_name: str, in_size: int, out_name: str,
+                  first: int, last: int) -> int:
+    """
+    Worker: encode blocks [first, last) from shared input into shared output.
+
+    Only shared-memory names and block indices cross the process boundary.
+    """
+    codec = stream_codec(level)
+    k = codec.block_data_size
+    nsize = codec.nsize
+    in_shm = shared_memory.SharedMemory(name=in_name, track=False)
+    out_shm = shared_memory.SharedMemory(name=out_name, track=False)
+    try:
+        data = np.ndarray((in_size,), dtype=np.uint8, buffer=in_shm.buf)
+        codewords = np.ndarray((codec.encoded_size(in_size),), dtype=np.uint8, buffer=out_shm.buf)
+        full_last = min(last, in_size // k)
+        for start in range(first, full_last, STREAM_CHUNK_BLOCKS):
+            end = min(start + STREAM_CHUNK_BLOCKS, full_last)
+            encode_batch(codec, data[start * k:end * k].reshape(-1, k),
+                         out=codewords[start * nsize:end * nsize].reshape(-1, nsize))
+        if last > full_last:
+            # Shortened final block
+            codec.encode_into(data[full_last * k:], codewords[full_last * nsize:])
+        del data, codewords
+    finally:
+        in_shm.close()
+        out_shm.close()
+    return last - first
+
+
+def _decode_shard(level: str, in_name: str, in_size: int, out_name: str,
+                  first: int, last: int) -> Tuple[int, int]:
+    """
+    Worker: decode blocks [first, last) from shared input into shared output.
+
+    Corrupted blocks are repaired in place in the shared input copy.
+
+    Returns:
+        Tuple of (corrected_positions, failed_blocks) for the shard
+    """
+    codec = stream_codec(level)
+    k = codec.block_data_size
+    nsize = codec.nsize
+    in_shm = shared_memory.SharedMemory(name=in_name, track=False)
+    out_shm = shared_memory.SharedMemory(name=out_name, track=False)
+    corrected = failed = 0
+    try:
+        received = np.ndarray((in_size,), dtype=np.uint8, buffer=in_shm.buf)
+        decoded = np.ndarray((codec.decoded_size(in_size),), dtype=np.uint8, buffer=out_shm.buf)
+        full_last = min(last, in_size // nsize)
+        for start in range(first, full_last, STREAM_CHUNK_BLOCKS):
+            end = min(start + STREAM_CHUNK_BLOCKS, full_last)
+            result = decode_batch(codec, received[start * nsize:end * nsize].reshape(-1, nsize))
+            decoded[start * k:end * k].reshape(-1, k)[:] = result.data
+            corrected += int(result.corrected.sum())
+            failed += int(np.count_nonzero(~result.success))
+            del result
+        if last > full_last:
+            _, tail_corrected, tail_failed = _decode_blocks(
+                codec, received[full_last * nsize:], decoded[full_last * k:], full_last, None
+            )
+            corrected += tail_corrected
+            failed += tail_failed
+        del received, decoded
+    finally:
+        in_shm.close()
+        out_shm.close()
+    return corrected, failed
+
+
+def _run_sharded(worker, level: str, src: memoryview, out_size: int, n_blocks: int,
+                 workers: Optional[int], executor: Optional[Executor]):
+    """
+    Copy src into shared memory, fan the blocks out to worker processes and
+    collect the shared output.
+
+    Returns:
+        Tuple of (output bytearray, list of per-shard worker results)
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = _shards(n_blocks, workers * PARALLEL_SHARDS_PER_WORKER)
+    if not shards:
+        return bytearray(out_size), []
+    in_shm = shared_memory.SharedMemory(create=True, size=max(len(src), 1))
+    out_shm = shared_memory.SharedMemory(create=True, size=max(out_size, 1))
+    try:
+        in_shm.buf[:len(src)] = src
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                pool.submit(worker, level, in_shm.name, len(src), out_shm.name, first, last)
+                for first, last in shards
+            ]
+            results = [future.result() for future in futures]
+        finally:
+            if executor is None:
+                pool.shutdown()
+        return bytearray(out_shm.buf[:out_size]), results
+    finally:
+        in_shm.close()
+        in_shm.unlink()
+        out_shm.close()
+        out_shm.unlink()
+
+
+def parallel_encode(data, level: str = "H", workers: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> bytearray:
+    """
+    Encode a large buffer across worker processes.
+
+    The input is placed in shared memory once and every worker writes its
+    codewords straight into a shared output segment, so no block data is
+    pickled. The result is identical to encode_stream() on the same data.
+
+    Args:
+        data: Any buffer-protocol object holding the message
+        level: Error correction level from ERROR_CORRECTION_LEVELS
+        workers: Number of processes (defaults to the CPU count)
+        executor: Optional process pool to reuse across calls
+
+    Returns:
+        The concatenated codewords
+    """
+    codec = stream_codec(level)
+    src = byte_view(data)
+    n_blocks = -(-len(src) // codec.block_data_size)
+    encoded, _ = _run_sharded(_encode_shard, level, src, codec.encoded_size(len(src)),
+                              n_blocks, workers, executor)
+    return encoded
+
+
+def parallel_decode(codewords, level: str = "H", workers: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> ParallelDecodeResult:
+    """
+    Decode a large buffer of codewords across worker processes.
+
+    Args:
+        codewords: Any buffer-protocol object holding the codewords
+        level: Error correction level the data was encoded with
+        workers: Number of processes (defaults to the CPU count)
+        executor: Optional process pool to reuse across calls
+
+    Returns:
+        ParallelDecodeResult with the decoded data and correction totals;
+        unrepairable blocks are copied through as received and a final
+        codeword truncated below its parity is a failed block with no data
+    """
+    codec = stream_codec(level)
+    src = byte_view(codewords)
+    n_blocks = -(-len(src) // codec.nsize)
+    decoded, results = _run_sharded(_decode_shard, level, src, codec.decoded_size(len(src)),
+                                    n_blocks, workers, executor)
+    corrected = sum(shard_corrected for shard_corrected, _ in results)
+    failed = sum(shard_failed for _, shard_failed in results)
+    return ParallelDecodeResult(decoded, corrected, failed)
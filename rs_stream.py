@@ -0,0 +1,379 @@
+"""Streaming Reed-Solomon encoding/decoding of files with fixed memory use."""
+
+import mmap
+import os
+from typing import BinaryIO, Callable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from batch_codec import decode_batch, encode_batch
+from codec_registry import get_codec
+from config import CODEC_BACKEND_TABLE, ERROR_CORRECTION_LEVELS, STREAM_CHUNK_BLOCKS
+from table_codec import TableRSCodec, UncorrectableError, byte_view
+
+# Called as on_block(block_index, corrected_positions, success)
+BlockCallback = Callable[[int, int, bool], None]
+
+
+class StreamEncodeReport(NamedTuple):
+    """Totals for one encode_stream() run."""
+    bytes_read: int
+    bytes_written: int
+    blocks: int
+
+
+class StreamDecodeReport(NamedTuple):
+    """Totals for one decode_stream() run."""
+    bytes_read: int
+    bytes_written: int
+    blocks: int
+    corrected: int      # corrected byte positions over all blocks
+    failed_blocks: int  # blocks written through unrepaired
+
+
+def stream_codec(level: str) -> TableRSCodec:
+    """
+    Codec for a QR-style error correction level.
+
+    Each level maps to a (255, 255 - n_parity) code, e.g. H is RS(255, 223).
+    """
+    if level not in ERROR_CORRECTION_LEVELS:
+        raise ValueError(f"Unknown error correction level: {level!r}")
+    return get_codec(ERROR_CORRECTION_LEVELS[level], backend=CODEC_BACKEND_TABLE)
+
+
+def read_full(src: BinaryIO, view: memoryview) -> int:
+    """
+    Fill view from src, retrying short reads until EOF.
+
+    Pipes and sockets may return fewer bytes than requested; blocks must stay
+    aligned, so only a read at end of stream may come back short.
+
+    Returns:
+        Number of bytes read (less than len(view) only at EOF)
+    """
+    filled = 0
+    while filled < len(view):
+        n = src.readinto(view[filled:])
+        if not n:
+            break
+        filled += n
+    return filled
+
+
+def _check_chunk_blocks(chunk_blocks: int):
+    """Reject chunk sizes that would leave no room to read into."""
+    if chunk_blocks < 1:
+        raise ValueError(f"chunk_blocks must be at least 1, got {chunk_blocks}")
+
+
+def _read_some(src: BinaryIO):
+    """
+    The stream's readinto variant that returns whatever one read yields.
+
+    BufferedReader.readinto() keeps reading a pipe until the buffer is full;
+    readinto1() makes at most one raw read, so data is processed as soon as
+    it arrives instead of waiting for a whole chunk.
+    """
+    return getattr(src, "readinto1", None) or src.readinto
+
+
+def encode_stream(src: BinaryIO, dst: BinaryIO, level: str = "H",
+                  chunk_blocks: int = STREAM_CHUNK_BLOCKS,
+                  flush: bool = False) -> StreamEncodeReport:
+    """
+    Encode a binary stream chunk by chunk.
+
+    Reads of up to chunk_blocks blocks are accepted as they arrive; every
+    complete block (255 - n_parity bytes) they contain is encoded at once by
+    encode_batch() and written before the next read, and a trailing partial
+    block is carried over. Memory use is fixed by chunk_blocks regardless of
+    the stream length, and only the final codeword may be shortened.
+
+    Args:
+        src: Readable binary file object (must support readinto)
+        dst: Writable binary file object
+        level: Error correction level from ERROR_CORRECTION_LEVELS
+        chunk_blocks: Maximum codewords processed per read
+        flush: Flush dst after every write, for pipelines that should see
+            each codeword as soon as it is ready
+
+    Returns:
+        StreamEncodeReport with byte and block totals
+
+    Raises:
+        ValueError: If chunk_blocks is less than 1
+    """
+    _check_chunk_blocks(chunk_blocks)
+    codec = stream_codec(level)
+    k = codec.block_data_size
+    nsize = codec.nsize
+    in_bytes = bytearray(chunk_blocks * k)
+    in_buf = memoryview(in_bytes)
+    data = np.frombuffer(in_bytes, dtype=np.uint8)
+    out = np.empty((chunk_blocks, nsize), dtype=np.uint8)
+    read_into = _read_some(src)
+
+    bytes_read = bytes_written = blocks = filled = 0
+    while True:
+        n = read_into(in_buf[filled:])
+        filled += n or 0
+        bytes_read += n or 0
+        full = filled // k
+        if full:
+            encode_batch(codec, data[:full * k].reshape(full, k), out=out[:full])
+            dst.write(byte_view(out[:full]))
+            bytes_written += full * nsize
+            blocks += full
+            carried = filled - full * k
+            in_buf[:carried] = in_buf[full * k:filled]
+            filled = carried
+        if not n:
+            if filled:
+                # Shortened final codeword
+                written = codec.encode_into(in_buf[:filled], out.reshape(-1))
+                dst.write(byte_view(out)[:written])
+                bytes_written += written
+                blocks += 1
+            if flush:
+                dst.flush()
+            break
+        if flush and full:
+            dst.flush()
+    return StreamEncodeReport(bytes_read, bytes_written, blocks)
+
+
+def decode_stream(src: BinaryIO, dst: BinaryIO, level: str = "H",
+                  chunk_blocks: int = STREAM_CHUNK_BLOCKS,
+                  on_block: Optional[BlockCallback] = None,
+                  flush: bool = False) -> StreamDecodeReport:
+    """
+    Decode a stream produced by encode_stream(), chunk by chunk.
+
+    Complete codewords are checked a read at a time by decode_batch(), so
+    only corrupted blocks take the scalar correction path. Blocks that cannot
+    be repaired are written through with their received data bytes and
+    counted as failed rather than aborting the stream, as is a truncated
+    final codeword too short to hold its parity (it yields no data).
+
+    Args:
+        src: Readable binary file object (must support readinto)
+        dst: Writable binary file object
+        level: Error correction level the stream was encoded with
+        chunk_blocks: Maximum codewords processed per read
+        on_block: Optional callback receiving per-block correction counts
+        flush: Flush dst after every write
+
+    Returns:
+        StreamDecodeReport with byte, block and correction totals
+
+    Raises:
+        ValueError: If chunk_blocks is less than 1
+    """
+    _check_chunk_blocks(chunk_blocks)
+    codec = stream_codec(level)
+    k = codec.block_data_size
+    nsize = codec.nsize
+    in_bytes = bytearray(chunk_blocks * nsize)
+    in_buf = memoryview(in_bytes)
+    received = np.frombuffer(in_bytes, dtype=np.uint8)
+    out = np.empty((chunk_blocks, k), dtype=np.uint8)
+    read_into = _read_some(src)
+
+    bytes_read = bytes_written = blocks = corrected = failed = filled = 0
+    while True:
+        n = read_into(in_buf[filled:])
+        filled += n or 0
+        bytes_read += n or 0
+        full = filled // nsize
+        if full:
+            # decode_batch repairs these rows of the input buffer in place
+            result = decode_batch(codec, received[:full * nsize].reshape(full, nsize))
+            out[:full] = result.data
+            dst.write(byte_view(out[:full]))
+            bytes_written += full * k
+            corrected += int(result.corrected.sum())
+            failed += int(np.count_nonzero(~result.success))
+            if on_block is not None:
+                for index, (n_corrected, success) in enumerate(zip(result.corrected, result.success), blocks):
+                    on_block(index, int(n_corrected), bool(success))
+            del result
+            blocks += full
+            carried = filled - full * nsize
+            in_buf[:carried] = in_buf[full * nsize:filled]
+            filled = carried
+        if not n:
+            if filled:
+                written, tail_corrected, tail_failed = _decode_blocks(
+                    codec, in_buf[:filled], out.reshape(-1), blocks, on_block
+                )
+                dst.write(byte_view(out)[:written])
+                bytes_written += written
+                blocks += 1
+                corrected += tail_corrected
+                failed += tail_failed
+            if flush:
+                dst.flush()
+            break
+        if flush and full:
+            dst.flush()
+    return StreamDecodeReport(bytes_read, bytes_written, blocks, corrected, failed)
+
+
+def _decode_blocks(codec: TableRSCodec, src, dst, first_block: int,
+                   on_block: Optional[BlockCallback]) -> Tuple[int, int, int]:
+    """
+    Decode consecutive codewords from src into dst one block at a time.
+
+    A final block no longer than the parity carries no data and is counted
+    as failed.
+
+    Args:
+        codec: Codec to decode with
+        src: Buffer holding whole codewords (the last one may be shortened)
+        dst: Writable buffer large enough for the decoded data
+        first_block: Stream index of the first block, for on_block
+        on_block: Optional per-block callback
+
+    Returns:
+        Tuple of (bytes_written, corrected_positions, failed_blocks)
+    """
+    src = byte_view(src)
+    dst = byte_view(dst, writable=True)
+    nsize = codec.nsize
+    nsym = codec.nsym
+    pos = corrected = failed = 0
+    for index, start in enumerate(range(0, len(src), nsize), first_block):
+        block = src[start:start + nsize]
+        if len(block) <= nsym:
+            # Truncated below its parity: no data survives
+            written, n_corrected, success = 0, 0, False
+            failed += 1
+        else:
+            try:
+                written, errata = codec.decode_into(block, dst[pos:])
+                n_corrected, success = len(errata), True
+            except UncorrectableError:
+                written = len(block) - nsym
+                dst[pos:pos + written] = block[:written]
+                n_corrected, success = 0, False
+                failed += 1
+        pos += written
+        corrected += n_corrected
+        if on_block is not None:
+            on_block(index, n_corrected, success)
+    return pos, corrected, failed
+
+
+def encode_file(input_path: str, output_path: str, level: str = "H") -> StreamEncodeReport:
+    """Encode a file on disk with encode_stream()."""
+    with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+        return encode_stream(src, dst, level)
+
+
+def decode_file(input_path: str, output_path: str, level: str = "H",
+                on_block: Optional[BlockCallback] = None) -> StreamDecodeReport:
+    """Decode a file on disk with decode_stream()."""
+    with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+        return decode_stream(src, dst, level, on_block=on_block)
+
+
+def encode_file_mmap(input_path: str, output_path: str, level: str = "H",
+                     chunk_blocks: int = STREAM_CHUNK_BLOCKS) -> StreamEncodeReport:
+    """
+    Encode a file through memory maps of the input and a pre-sized output.
+
+    Full blocks are encoded chunk_blocks at a time by the vectorized batch
+    kernel, reading from and writing to array views of the mapped pages, so no
+    read()/write() copies are made; only a final short block goes through the
+    scalar encoder.
+
+    Args:
+        input_path: File to protect
+        output_path: Destination file (created or truncated to the exact size)
+        level: Error correction level from ERROR_CORRECTION_LEVELS
+        chunk_blocks: Codewords per vectorized step
+
+    Returns:
+        StreamEncodeReport with byte and block totals
+    """
+    codec = stream_codec(level)
+    k = codec.block_data_size
+    nsize = codec.nsize
+    with open(input_path, "rb") as src, open(output_path, "w+b") as dst:
+        size = os.fstat(src.fileno()).st_size
+        out_size = codec.encoded_size(size)
+        dst.truncate(out_size)
+        if size == 0:
+            return StreamEncodeReport(0, 0, 0)
+
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as src_map, \
+                mmap.mmap(dst.fileno(), out_size) as dst_map:
+            data = np.frombuffer(src_map, dtype=np.uint8)
+            codewords = np.frombuffer(dst_map, dtype=np.uint8)
+            full = size // k
+            for first in range(0, full, chunk_blocks):
+                last = min(first + chunk_blocks, full)
+                encode_batch(codec, data[first * k:last * k].reshape(-1, k),
+                             out=codewords[first * nsize:last * nsize].reshape(-1, nsize))
+            if size % k:
+                codec.encode_into(data[full * k:], codewords[full * nsize:])
+            # The maps cannot close while arrays still export their buffers
+            del data, codewords
+    return StreamEncodeReport(size, out_size, -(-size // k))
+
+
+def decode_file_mmap(input_path: str, output_path: str, level: str = "H",
+                     chunk_blocks: int = STREAM_CHUNK_BLOCKS,
+                     on_block: Optional[BlockCallback] = None) -> StreamDecodeReport:
+    """
+    Decode a file through memory maps, the counterpart of encode_file_mmap().
+
+    Full blocks are checked chunk_blocks at a time by decode_batch(); only
+    corrupted blocks take the scalar correction path. Failed and truncated
+    blocks are counted as in decode_stream().
+
+    Args:
+        input_path: Encoded file
+        output_path: Destination file (created or truncated to the exact size)
+        level: Error correction level the file was encoded with
+        chunk_blocks: Codewords per vectorized step
+        on_block: Optional callback receiving per-block correction counts
+
+    Returns:
+        StreamDecodeReport with byte, block and correction totals
+    """
+    codec = stream_codec(level)
+    k = codec.block_data_size
+    nsize = codec.nsize
+    with open(input_path, "rb") as src, open(output_path, "w+b") as dst:
+        size = os.fstat(src.fileno()).st_size
+        out_size = codec.decoded_size(size)
+        dst.truncate(out_size)
+        if size == 0:
+            return StreamDecodeReport(0, 0, 0, 0, 0)
+
+        corrected = failed = 0
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as src_map, \
+                mmap.mmap(dst.fileno(), out_size) as dst_map:
+            received = np.frombuffer(src_map, dtype=np.uint8)
+            decoded = np.frombuffer(dst_map, dtype=np.uint8)
+            full = size // nsize
+            for first in range(0, full, chunk_blocks):
+                last = min(first + chunk_blocks, full)
+                # decode_batch repairs a private copy of this read-only chunk
+                result = decode_batch(codec, received[first * nsize:last * nsize].reshape(-1, nsize))
+                decoded[first * k:last * k].reshape(-1, k)[:] = result.data
+                corrected += int(result.corrected.sum())
+                failed += int(np.count_nonzero(~result.success))
+                if on_block is not None:
+                    for index, (n_corrected, success) in enumerate(zip(result.corrected, result.success), first):
+                        on_block(index, int(n_corrected), bool(success))
+            if size % nsize:
+                _, tail_corrected, tail_failed = _decode_blocks(
+                    codec, received[full * nsize:], decoded[full * k:], full, on_block
+                )
+                corrected += tail_corrected
+                failed += tail_failed
+            del received, decoded
+    return StreamDecodeReport(size, out_size, -(-size // nsize), corrected, failed)
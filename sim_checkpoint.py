@@ -0,0 +1,295 @@
+"""
+Checkpoint, resume and merge long Monte Carlo sweeps.
+
+A sweep's random streams are fully determined by its master seed entropy and
+each chunk's (point, chunk) index (see simulation.chunk_streams()), so the
+only state worth saving is which chunks have run and what they counted.
+Checkpoints record exactly that as small JSON files, written atomically; a
+resumed sweep skips the recorded chunks and ends with the same counts as an
+uninterrupted one, and checkpoints from hosts that ran disjoint shards of
+the same sweep merge into the full result.
+
+Usage:
+    python sim_checkpoint.py show CHECKPOINT
+    python sim_checkpoint.py merge OUTPUT CHECKPOINT [CHECKPOINT ...]
+"""
+
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from config import SIM_BATCH_SIZE, SIM_CHECKPOINT_EVERY, SIM_CHUNK_TRIALS, SIM_DEFAULT_TRIALS
+from simulation import OperatingPoint, SimulationResult, _run_chunk, format_results, message_length
+
+CHECKPOINT_VERSION = 1
+
+
+class Checkpoint:
+    """
+    Completed chunks of one sweep.
+
+    Per point, finished chunks are kept as sorted, coalesced ranges
+    [first, last, trials, frame_errors, byte_errors] covering chunk indices
+    first..last-1, so a contiguous run of any length costs one entry. Only
+    chunks of the same size are coalesced, so every chunk in a range ran
+    trials // (last - first) trials.
+    """
+
+    def __init__(self, points: List[OperatingPoint], entropy: int,
+                 chunk_trials: int = SIM_CHUNK_TRIALS):
+        """
+        Args:
+            points: Operating points of the sweep, in order (chunk streams are
+                keyed by point index, so the order is part of the sweep)
+            entropy: Master SeedSequence entropy
+            chunk_trials: Trials per chunk
+        """
+        self.points = list(points)
+        self.entropy = entropy
+        self.chunk_trials = chunk_trials
+        self.ranges: List[List[List[int]]] = [[] for _ in self.points]
+
+    def covered(self, point_index: int, chunk_index: int) -> bool:
+        """Whether a chunk's counts are already recorded."""
+        return any(first <= chunk_index < last for first, last, *_ in self.ranges[point_index])
+
+    def add(self, point_index: int, chunk_index: int, trials: int,
+            frame_errors: int, byte_errors: int):
+        """Record one finished chunk (recording it twice is a no-op)."""
+        if not self.covered(point_index, chunk_index):
+            self._insert(point_index, [chunk_index, chunk_index + 1, trials, frame_errors, byte_errors])
+
+    def _insert(self, point_index: int, entry: List[int]):
+        """Insert a range that overlaps nothing recorded and coalesce neighbours of the same chunk size."""
+        ranges = self.ranges[point_index]
+        ranges.append(entry)
+        ranges.sort()
+        merged = [ranges[0]]
+        for first, last, trials, frame_errors, byte_errors in ranges[1:]:
+            prev = merged[-1]
+            if prev[1] == first and prev[2] * (last - first) == trials * (prev[1] - prev[0]):
+                merged[-1] = [prev[0], last, prev[2] + trials, prev[3] + frame_errors, prev[4] + byte_errors]
+            else:
+                merged.append([first, last, trials, frame_errors, byte_errors])
+        self.ranges[point_index] = merged
+
+    def chunk_size(self, chunk_index: int, trials: int) -> int:
+        """Trials run by a chunk of a sweep of trials per point (0 past its end)."""
+        return max(0, min(self.chunk_trials, trials - chunk_index * self.chunk_trials))
+
+    def check_trials(self, trials: int):
+        """
+        Raise ValueError unless every recorded chunk has the size it would
+        have in a sweep of trials per point.
+
+        Resuming with a different trial count is only safe while the
+        recorded chunks keep their size, e.g. when the earlier count was a
+        multiple of chunk_trials; otherwise a short final chunk would be
+        counted as if it were a full one.
+        """
+        for point_index, ranges in enumerate(self.ranges):
+            for first, last, recorded, *_ in ranges:
+                expected = sum(self.chunk_size(index, trials) for index in range(first, last))
+                if recorded != expected:
+                    raise ValueError(
+                        f"Point {point_index}: chunks {first}..{last - 1} ran {recorded} trials, "
+                        f"but a sweep of {trials} trials per point gives them {expected}."
+                    )
+
+    def compatible(self, other: "Checkpoint") -> bool:
+        """Whether two checkpoints are shards of the same sweep."""
+        return (self.points == other.points and self.entropy == other.entropy
+                and self.chunk_trials == other.chunk_trials)
+
+    def merge(self, other: "Checkpoint"):
+        """
+        Fold in the chunks recorded by another run of the same sweep.
+
+        Identical ranges are skipped; ranges that partially overlap cannot
+        be split back into chunks and raise ValueError.
+        """
+        if not self.compatible(other):
+            raise ValueError("Checkpoints belong to different sweeps (points, seed or chunk size differ).")
+        for point_index, ranges in enumerate(other.ranges):
+            for entry in ranges:
+                if entry in self.ranges[point_index]:
+                    continue
+                first, last = entry[0], entry[1]
+                if any(f < last and first < l for f, l, *_ in self.ranges[point_index]):
+                    raise ValueError(
+                        f"Point {point_index}: chunks {first}..{last - 1} partially overlap recorded ranges."
+                    )
+                self._insert(point_index, list(entry))
+
+    def results(self) -> List[SimulationResult]:
+        """Totals over every recorded chunk, one SimulationResult per point."""
+        results = []
+        for point, ranges in zip(self.points, self.ranges):
+            trials = sum(entry[2] for entry in ranges)
+            frame_errors = sum(entry[3] for entry in ranges)
+            byte_errors = sum(entry[4] for entry in ranges)
+            results.append(SimulationResult(point, trials, frame_errors, byte_errors,
+                                            trials * message_length(point)))
+        return results
+
+    def to_json(self) -> dict:
+        """JSON-serializable form of the checkpoint."""
+        return {
+            "version": CHECKPOINT_VERSION,
+            "entropy": self.entropy,
+            "chunk_trials": self.chunk_trials,
+            "points": [list(point) for point in self.points],
+            "ranges": self.ranges,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Checkpoint":
+        """Rebuild a checkpoint from to_json() output."""
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data.get('version')!r}")
+        checkpoint = cls([OperatingPoint(*point) for point in data["points"]],
+                         data["entropy"], data["chunk_trials"])
+        checkpoint.ranges = [[list(entry) for entry in ranges] for ranges in data["ranges"]]
+        return checkpoint
+
+    def save(self, path: str):
+        """
+        Write the checkpoint atomically.
+
+        The JSON goes to a temporary file in the same directory, is flushed
+        to disk and then renamed over path, so a crash mid-write leaves the
+        previous checkpoint intact.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.to_json(), f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        """Read a checkpoint written by save()."""
+        with open(path) as f:
+            return cls.from_json(json.load(f))
+
+
+def merge_checkpoints(paths: List[str]) -> Checkpoint:
+    """Merge the checkpoints of several runs/hosts of the same sweep."""
+    if not paths:
+        raise ValueError("Need at least one checkpoint to merge.")
+    merged = Checkpoint.load(paths[0])
+    for path in paths[1:]:
+        merged.merge(Checkpoint.load(path))
+    return merged
+
+
+def checkpointed_sweep(points: List[OperatingPoint], checkpoint_path: str,
+                       trials: int = SIM_DEFAULT_TRIALS, seed: Optional[int] = None,
+                       batch_size: int = SIM_BATCH_SIZE, workers: Optional[int] = None,
+                       executor: Optional[Executor] = None,
+                       chunk_trials: int = SIM_CHUNK_TRIALS,
+                       shard: Tuple[int, int] = (0, 1),
+                       checkpoint_every: int = SIM_CHECKPOINT_EVERY) -> List[SimulationResult]:
+    """
+    Run simulation.sweep() with a resumable on-disk checkpoint.
+
+    If checkpoint_path exists the sweep resumes from it: its recorded chunks
+    are skipped and its seed entropy is reused (a seed, if given, must match).
+    The checkpoint is rewritten every checkpoint_every finished chunks and
+    once more on exit, including on KeyboardInterrupt.
+
+    To split a sweep across hosts, give each host the same seed and a
+    different shard=(index, count); each runs the chunks whose index is
+    index modulo count, and merge_checkpoints() combines their files. A
+    resume may raise trials only while the recorded chunks keep their size
+    (the earlier trials a multiple of chunk_trials); otherwise it raises
+    ValueError.
+
+    Args:
+        points: Operating points, in the same order on every run
+        checkpoint_path: JSON checkpoint to resume from and write to
+        trials: Trials per operating point
+        seed: Master seed (fresh entropy if None and no checkpoint exists)
+        batch_size: Codewords per vectorized encode/decode
+        workers: Number of processes (defaults to the CPU count)
+        executor: Optional process pool to reuse across calls
+        chunk_trials: Trials per independently seeded chunk
+        shard: (index, count) selecting this run's share of the chunks
+        checkpoint_every: Finished chunks between checkpoint writes
+
+    Returns:
+        One SimulationResult per point over every chunk in the checkpoint
+    """
+    if os.path.exists(checkpoint_path):
+        checkpoint = Checkpoint.load(checkpoint_path)
+        expected = Checkpoint(points, checkpoint.entropy if seed is None
+                              else np.random.SeedSequence(seed).entropy, chunk_trials)
+        if not checkpoint.compatible(expected):
+            raise ValueError(f"{checkpoint_path} was written by a different sweep.")
+        checkpoint.check_trials(trials)
+    else:
+        checkpoint = Checkpoint(points, np.random.SeedSequence(seed).entropy, chunk_trials)
+
+    shard_index, shard_count = shard
+    jobs = [
+        (point, point_index, chunk_index, min(chunk_trials, trials - start), checkpoint.entropy, batch_size)
+        for point_index, point in enumerate(points)
+        for chunk_index, start in enumerate(range(0, trials, chunk_trials))
+        if chunk_index % shard_count == shard_index and not checkpoint.covered(point_index, chunk_index)
+    ]
+
+    finished = 0
+
+    def record(job: tuple, counts: Tuple[int, int]):
+        nonlocal finished
+        _, point_index, chunk_index, chunk_size, _, _ = job
+        checkpoint.add(point_index, chunk_index, chunk_size, *counts)
+        finished += 1
+        if finished % checkpoint_every == 0:
+            checkpoint.save(checkpoint_path)
+
+    workers = workers or os.cpu_count() or 1
+    try:
+        if executor is None and workers == 1:
+            for job in jobs:
+                record(job, _run_chunk(*job))
+        else:
+            pool = executor or ProcessPoolExecutor(max_workers=workers)
+            try:
+                futures = {pool.submit(_run_chunk, *job): job for job in jobs}
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+            finally:
+                if executor is None:
+                    pool.shutdown(cancel_futures=True)
+    finally:
+        checkpoint.save(checkpoint_path)
+    return checkpoint.results()
+
+
+def main():
+    """Show a checkpoint's results or merge several checkpoints."""
+    if len(sys.argv) >= 3 and sys.argv[1] == "show":
+        print(format_results(Checkpoint.load(sys.argv[2]).results()))
+    elif len(sys.argv) >= 4 and sys.argv[1] == "merge":
+        merged = merge_checkpoints(sys.argv[3:])
+        merged.save(sys.argv[2])
+        print(format_results(merged.results()))
+    else:
+        print(__doc__.strip().split("Usage:")[1].strip("\n"))
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
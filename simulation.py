@@ -0,0 +1,427 @@
+"""
+Monte Carlo frame/byte error rate simulation across error correction levels.
+
+Each trial encodes a random message, passes the codeword through the
+corruption channel and decodes it. A frame error is any trial whose decoded
+data differs from the message (decode failure or miscorrection); byte errors
+count the wrong data bytes left after decoding.
+
+Trials are split into fixed-size chunks, each with its own random streams
+derived from the master seed and the (point, chunk) index, so results depend
+only on the seed and never on how many worker processes ran the chunks.
+
+Usage:
+    python simulation.py [trials_per_point] [workers]
+"""
+
+import math
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from config import (
+    ERROR_CORRECTION_LEVELS, CORRUPTION_MODE_XOR, CORRUPTION_MODE_AWGN,
+    CORRUPTION_MODE_BURST, CORRUPTION_MODE_GE, CORRUPTION_MODE_BSC,
+    SIM_BATCH_SIZE, SIM_CHUNK_TRIALS, SIM_DEFAULT_TRIALS, SIM_CONFIDENCE_Z,
+    SIM_TARGET_REL_CI, SIM_MIN_FAILURES, SIM_MAX_TRIALS
+)
+from batch_corruption import corrupt_batch
+from reed_solomon_codec import ReedSolomonEncoder
+
+
+class OperatingPoint(NamedTuple):
+    """One channel condition to simulate."""
+    level: str
+    mode: str                    # one of the CORRUPTION_MODE_* constants
+    n_errors: int                # bytes corrupted per codeword (burst length
+                                 # for bursts, the mean for Gilbert-Elliott)
+    sigma: Optional[float] = None
+    message_len: Optional[int] = None  # defaults to a full block for the level
+    bit_error_rate: Optional[float] = None  # BSC bit flip probability
+
+
+class SimulationResult(NamedTuple):
+    """Aggregated counts for one operating point."""
+    point: OperatingPoint
+    trials: int
+    frame_errors: int
+    byte_errors: int
+    data_bytes: int
+
+    @property
+    def fer(self) -> float:
+        """Frame error rate."""
+        return self.frame_errors / self.trials if self.trials else 0.0
+
+    @property
+    def ber(self) -> float:
+        """Post-decoding byte error rate over the data bytes."""
+        return self.byte_errors / self.data_bytes if self.data_bytes else 0.0
+
+    @property
+    def fer_interval(self) -> Tuple[float, float]:
+        """Wilson score confidence interval of the frame error rate."""
+        return wilson_interval(self.frame_errors, self.trials)
+
+    @property
+    def ber_interval(self) -> Tuple[float, float]:
+        """Wilson score confidence interval of the byte error rate."""
+        return wilson_interval(self.byte_errors, self.data_bytes)
+
+    @property
+    def fer_relative_error(self) -> float:
+        """Half-width of the FER interval relative to the FER (inf before any failure)."""
+        if self.frame_errors == 0:
+            return math.inf
+        low, high = self.fer_interval
+        return (high - low) / 2 / self.fer
+
+
+def wilson_interval(successes: int, trials: int, z: float = SIM_CONFIDENCE_Z) -> Tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion.
+
+    Unlike the normal approximation it stays inside [0, 1] and is usable when
+    no failures have been observed yet.
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    z2 = z * z
+    denom = 1 + z2 / trials
+    center = (p + z2 / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def message_length(point: OperatingPoint) -> int:
+    """Data bytes per trial codeword for an operating point."""
+    n_parity = ERROR_CORRECTION_LEVELS[point.level]
+    return point.message_len or 255 - n_parity
+
+
+def chunk_streams(entropy: int, point_index: int,
+                  chunk_index: int) -> Tuple[np.random.Generator, np.random.Generator]:
+    """
+    Independent random streams for one chunk of trials.
+
+    The SeedSequence spawn key is the (point, chunk) index, so every chunk
+    draws the same numbers no matter which process runs it or in what order.
+
+    Returns:
+        Tuple of (message generator, channel generator)
+    """
+    seq = np.random.SeedSequence(entropy, spawn_key=(point_index, chunk_index))
+    message_seq, channel_seq = seq.spawn(2)
+    return np.random.default_rng(message_seq), np.random.default_rng(channel_seq)
+
+
+def run_trials(point: OperatingPoint, trials: int, rng: np.random.Generator,
+               batch_size: int = SIM_BATCH_SIZE,
+               channel_rng: Optional[np.random.Generator] = None) -> SimulationResult:
+    """
+    Simulate one operating point.
+
+    Messages are encoded, corrupted and decoded in vectorized batches; the
+    channel is batch_corruption.corrupt_batch(), the array form of
+    corruption.apply_corruption().
+
+    Args:
+        point: Channel condition to simulate
+        trials: Number of codewords to send
+        rng: Source of the random messages
+        batch_size: Codewords per vectorized encode/decode
+        channel_rng: Source of the corruption (defaults to rng)
+
+    Returns:
+        SimulationResult with the accumulated counts
+    """
+    encoder = ReedSolomonEncoder(ERROR_CORRECTION_LEVELS[point.level])
+    channel_rng = channel_rng if channel_rng is not None else rng
+    k = message_length(point)
+    frame_errors = byte_errors = 0
+    done = 0
+    while done < trials:
+        batch = min(batch_size, trials - done)
+        messages = rng.integers(0, 256, size=(batch, k), dtype=np.uint8)
+        codewords = encoder.encode_batch(messages)
+        corrupt_batch(codewords, point.n_errors, point.mode, point.sigma, channel_rng,
+                      bit_error_rate=point.bit_error_rate)
+
+        result = encoder.decode_batch(codewords)
+        wrong = result.data != messages
+        wrong_per_frame = wrong.sum(axis=1)
+        frame_errors += int(np.count_nonzero((wrong_per_frame > 0) | ~result.success))
+        byte_errors += int(wrong_per_frame.sum())
+        done += batch
+    return SimulationResult(point, trials, frame_errors, byte_errors, trials * k)
+
+
+def operating_points(levels: Optional[Iterable[str]] = None,
+                     error_counts: Iterable[int] = (),
+                     sigmas: Iterable[float] = (),
+                     burst_lengths: Iterable[int] = (),
+                     ge_mean_errors: Iterable[int] = (),
+                     bit_error_rates: Iterable[float] = (),
+                     message_len: Optional[int] = None) -> List[OperatingPoint]:
+    """
+    Build the sweep grid.
+
+    XOR points corrupt the given number of bytes per codeword; AWGN points add
+    noise of the given sigma to every byte of the codeword.
+
+    Args:
+        levels: Error correction levels (defaults to all of them)
+        error_counts: Corrupted bytes per codeword for the XOR channel
+        sigmas: Noise standard deviations for the AWGN channel
+        burst_lengths: Burst lengths for the burst channel
+        ge_mean_errors: Average corrupted bytes for the Gilbert-Elliott channel
+        bit_error_rates: Bit flip probabilities for the binary symmetric channel
+        message_len: Data bytes per codeword (defaults to a full block)
+    """
+    points = []
+    for level in levels or ERROR_CORRECTION_LEVELS:
+        n_parity = ERROR_CORRECTION_LEVELS[level]
+        n = (message_len or 255 - n_parity) + n_parity
+        for n_errors in error_counts:
+            points.append(OperatingPoint(level, CORRUPTION_MODE_XOR, n_errors, None, message_len))
+        for sigma in sigmas:
+            points.append(OperatingPoint(level, CORRUPTION_MODE_AWGN, n, sigma, message_len))
+        for length in burst_lengths:
+            points.append(OperatingPoint(level, CORRUPTION_MODE_BURST, length, None, message_len))
+        for mean_errors in ge_mean_errors:
+            points.append(OperatingPoint(level, CORRUPTION_MODE_GE, mean_errors, None, message_len))
+        for bit_error_rate in bit_error_rates:
+            points.append(OperatingPoint(level, CORRUPTION_MODE_BSC, 0, None, message_len, bit_error_rate))
+    return points
+
+
+def _run_chunk(point: OperatingPoint, point_index: int, chunk_index: int, trials: int,
+               entropy: int, batch_size: int) -> Tuple[int, int]:
+    """
+    Worker: simulate one chunk of an operating point with its own streams.
+
+    Returns:
+        Tuple of (frame_errors, byte_errors) for the chunk
+    """
+    rng, channel_rng = chunk_streams(entropy, point_index, chunk_index)
+    result = run_trials(point, trials, rng, batch_size, channel_rng)
+    return result.frame_errors, result.byte_errors
+
+
+def sweep(points: List[OperatingPoint], trials: int = SIM_DEFAULT_TRIALS,
+          seed: Optional[int] = None, batch_size: int = SIM_BATCH_SIZE,
+          workers: Optional[int] = None, executor: Optional[Executor] = None,
+          chunk_trials: int = SIM_CHUNK_TRIALS) -> List[SimulationResult]:
+    """
+    Simulate every operating point with the same number of trials.
+
+    Each point is cut into chunks of chunk_trials trials that run across a
+    process pool. For a given seed and chunk_trials the counts are identical
+    for any number of workers, including the in-process workers=1 path.
+
+    Args:
+        points: Operating points, e.g. from operating_points()
+        trials: Trials per operating point
+        seed: Master seed for reproducible runs (fresh entropy if None)
+        batch_size: Codewords per vectorized encode/decode
+        workers: Number of processes (defaults to the CPU count)
+        executor: Optional process pool to reuse across calls
+        chunk_trials: Trials per independently seeded chunk
+
+    Returns:
+        One SimulationResult per point, in order
+    """
+    entropy = np.random.SeedSequence(seed).entropy
+    jobs = [
+        (point, point_index, chunk_index, min(chunk_trials, trials - start), entropy, batch_size)
+        for point_index, point in enumerate(points)
+        for chunk_index, start in enumerate(range(0, trials, chunk_trials))
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if executor is None and workers == 1:
+        counts = [_run_chunk(*job) for job in jobs]
+    else:
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [pool.submit(_run_chunk, *job) for job in jobs]
+            counts = [future.result() for future in futures]
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+    # Sum chunk counts per point in job order
+    totals = [[0, 0] for _ in points]
+    for job, (frame_errors, byte_errors) in zip(jobs, counts):
+        point_index = job[1]
+        totals[point_index][0] += frame_errors
+        totals[point_index][1] += byte_errors
+    return [
+        SimulationResult(point, trials, frame_errors, byte_errors, trials * message_length(point))
+        for point, (frame_errors, byte_errors) in zip(points, totals)
+    ]
+
+
+def channel_label(point: OperatingPoint) -> str:
+    """Short description of an operating point's channel."""
+    if point.mode == CORRUPTION_MODE_AWGN:
+        return f"AWGN s={point.sigma:g}"
+    if point.mode == CORRUPTION_MODE_BURST:
+        return f"Burst x{point.n_errors}"
+    if point.mode == CORRUPTION_MODE_GE:
+        return f"GE mean {point.n_errors}"
+    if point.mode == CORRUPTION_MODE_BSC:
+        return f"BSC p={point.bit_error_rate:g}"
+    return f"XOR x{point.n_errors}"
+
+
+def stopping_reached(result: SimulationResult, target_rel_ci: Optional[float] = SIM_TARGET_REL_CI,
+                     min_failures: Optional[int] = SIM_MIN_FAILURES) -> bool:
+    """
+    Whether a point has enough samples: its relative FER interval is within
+    target_rel_ci or it has seen min_failures frame errors (None disables a
+    criterion).
+    """
+    if min_failures is not None and result.frame_errors >= min_failures:
+        return True
+    return target_rel_ci is not None and result.fer_relative_error <= target_rel_ci
+
+
+def adaptive_sweep(points: List[OperatingPoint], seed: Optional[int] = None,
+                   target_rel_ci: Optional[float] = SIM_TARGET_REL_CI,
+                   min_failures: Optional[int] = SIM_MIN_FAILURES,
+                   max_trials: int = SIM_MAX_TRIALS, batch_size: int = SIM_BATCH_SIZE,
+                   workers: Optional[int] = None, executor: Optional[Executor] = None,
+                   chunk_trials: int = SIM_CHUNK_TRIALS) -> List[SimulationResult]:
+    """
+    Simulate every operating point until its estimate is good enough.
+
+    Chunks are seeded exactly as in sweep() and each point folds in its chunk
+    results strictly in chunk order, stopping at the first chunk after which
+    stopping_reached() holds (or max_trials is spent). Chunks finished past
+    that point are discarded, so the result depends only on the seed, never
+    on the worker count or completion order. Once a point stops, its queued
+    chunks are cancelled and the pool is refilled with chunks of the points
+    still running, the ones with the fewest chunks in flight first.
+
+    Args:
+        points: Operating points, e.g. from operating_points()
+        seed: Master seed for reproducible runs (fresh entropy if None)
+        target_rel_ci: Stop once the FER interval half-width is this fraction
+            of the FER
+        min_failures: Stop once this many frame errors have been seen
+        max_trials: Upper bound on trials per point
+        batch_size: Codewords per vectorized encode/decode
+        workers: Number of processes (defaults to the CPU count)
+        executor: Optional process pool to reuse across calls
+        chunk_trials: Trials per independently seeded chunk
+
+    Returns:
+        One SimulationResult per point, in order; check stopping_reached()
+        to tell converged points from ones that hit max_trials
+    """
+    entropy = np.random.SeedSequence(seed).entropy
+    max_chunks = -(-max_trials // chunk_trials)
+    results = [SimulationResult(point, 0, 0, 0, 0) for point in points]
+    done = [max_chunks == 0] * len(points)
+    consumed = [0] * len(points)                # chunks folded into results
+    waiting = [{} for _ in points]              # finished chunks awaiting earlier ones
+
+    def job(point_index: int, chunk_index: int) -> tuple:
+        trials = min(chunk_trials, max_trials - chunk_index * chunk_trials)
+        return points[point_index], point_index, chunk_index, trials, entropy, batch_size
+
+    def fold(point_index: int, chunk_index: int, counts: Tuple[int, int]):
+        waiting[point_index][chunk_index] = counts
+        while not done[point_index] and consumed[point_index] in waiting[point_index]:
+            frame_errors, byte_errors = waiting[point_index].pop(consumed[point_index])
+            trials = job(point_index, consumed[point_index])[3]
+            r = results[point_index]
+            results[point_index] = r._replace(
+                trials=r.trials + trials,
+                frame_errors=r.frame_errors + frame_errors,
+                byte_errors=r.byte_errors + byte_errors,
+                data_bytes=r.data_bytes + trials * message_length(r.point),
+            )
+            consumed[point_index] += 1
+            done[point_index] = (consumed[point_index] == max_chunks
+                                 or stopping_reached(results[point_index], target_rel_ci, min_failures))
+        if done[point_index]:
+            waiting[point_index].clear()
+
+    workers = workers or os.cpu_count() or 1
+    if executor is None and workers == 1:
+        for point_index in range(len(points)):
+            chunk_index = 0
+            while not done[point_index]:
+                fold(point_index, chunk_index, _run_chunk(*job(point_index, chunk_index)))
+                chunk_index += 1
+        return results
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    submitted = [0] * len(points)
+    in_flight = {}  # future -> (point_index, chunk_index)
+    try:
+        while True:
+            # Keep every worker busy with the points that still need samples
+            while len(in_flight) < 2 * workers:
+                running = [i for i in range(len(points)) if not done[i] and submitted[i] < max_chunks]
+                if not running:
+                    break
+                point_index = min(running, key=lambda i: (submitted[i] - consumed[i], i))
+                future = pool.submit(_run_chunk, *job(point_index, submitted[point_index]))
+                in_flight[future] = (point_index, submitted[point_index])
+                submitted[point_index] += 1
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                point_index, chunk_index = in_flight.pop(future)
+                if not done[point_index]:
+                    fold(point_index, chunk_index, future.result())
+            for future, (point_index, _) in list(in_flight.items()):
+                if done[point_index] and future.cancel():
+                    del in_flight[future]
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+    return results
+
+
+def format_results(results: List[SimulationResult]) -> str:
+    """Render simulation results as a text table."""
+    lines = [
+        f"{'Level':<6}{'Channel':<14}{'Trials':>10}{'FER':>12}{'FER 95% CI':>26}{'BER':>12}"
+    ]
+    for r in results:
+        p = r.point
+        channel = channel_label(p)
+        low, high = r.fer_interval
+        lines.append(
+            f"{p.level:<6}{channel:<14}{r.trials:>10}{r.fer:>12.3e}"
+            f"{f'[{low:.2e}, {high:.2e}]':>26}{r.ber:>12.3e}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Run a default sweep around each level's correction limit."""
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else SIM_DEFAULT_TRIALS
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    points = []
+    for level, n_parity in ERROR_CORRECTION_LEVELS.items():
+        t = n_parity // 2
+        points += operating_points([level], error_counts=(t - 1, t, t + 1, t + 2))
+    points += operating_points(sigmas=(0.15, 0.2, 0.25))
+    points += operating_points(["H"], burst_lengths=(16, 17), ge_mean_errors=(4, 8),
+                               bit_error_rates=(2e-3, 4e-3))
+    print(format_results(sweep(points, trials, seed=0, workers=workers)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Soft-decision Reed-Solomon decoding from per-byte reliability information."""
+
+from typing import NamedTuple, Optional, Sequence
+
+from table_codec import TableRSCodec, UncorrectableError
+
+
+class SoftDecodeResult(NamedTuple):
+    """Outcome of soft_decode()."""
+    success: bool
+    decoded_bytes: Optional[bytes]  # message bytes of the chosen codeword
+    erasures: int                   # least reliable bytes erased in the winning trial
+    trials: int                     # decoding attempts made
+
+
+def soft_decode_block(codec: TableRSCodec, block: bytes,
+                      confidence: Sequence[float]) -> SoftDecodeResult:
+    """
+    Generalized-minimum-distance decoding of a single codeword.
+
+    Trials erase the 0, 2, 4, ... nsym least reliable bytes; each erasure
+    frees one parity byte for the remaining errors. The first trial that
+    decodes wins, so the hard-decision result is kept whenever it exists and
+    soft information is only spent on words the hard decoder gives up on.
+
+    Args:
+        codec: Codec the block was encoded with
+        block: One received codeword
+        confidence: Reliability of each byte (higher is more reliable)
+
+    Returns:
+        SoftDecodeResult for the block
+    """
+    order = sorted(range(len(block)), key=confidence.__getitem__)
+    trials = 0
+    for n_erasures in range(0, min(codec.nsym, len(block)) + 1, 2):
+        trials += 1
+        try:
+            decoded, _, _ = codec.decode(block, erase_pos=order[:n_erasures])
+        except UncorrectableError:
+            continue
+        return SoftDecodeResult(True, bytes(decoded), n_erasures, trials)
+    return SoftDecodeResult(False, None, 0, trials)
+
+
+def soft_decode(codec: TableRSCodec, received: bytes,
+                confidence: Sequence[float]) -> SoftDecodeResult:
+    """
+    Soft-decision decode one or more concatenated codewords block by block.
+
+    Args:
+        codec: Codec the data was encoded with
+        received: Hard-decision codewords
+        confidence: Reliability of each received byte
+
+    Returns:
+        SoftDecodeResult; erasures is the largest count used by any block and
+        trials the total across blocks
+    """
+    if len(confidence) != len(received):
+        raise ValueError("Need one confidence value per received byte.")
+    decoded = bytearray()
+    max_erasures = trials = 0
+    for start in range(0, len(received), codec.nsize):
+        end = start + codec.nsize
+        result = soft_decode_block(codec, bytes(received[start:end]), confidence[start:end])
+        trials += result.trials
+        if not result.success:
+            return SoftDecodeResult(False, None, 0, trials)
+        decoded += result.decoded_bytes
+        max_erasures = max(max_erasures, result.erasures)
+    return SoftDecodeResult(True, bytes(decoded), max_erasures, trials)
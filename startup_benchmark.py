@@ -0,0 +1,94 @@
+"""
+Cold-start import benchmark for the command line entry points.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters and
+reports the median cumulative import time of main.py and cli.py against
+STARTUP_BUDGET_MS. It also checks that the heavy dependencies (NumPy, the
+codec backends, the simulation engine, random and the UI helpers) are not
+imported at startup; they are meant to load on first use. Exits with
+status 1 if either check fails, so it can gate CI.
+
+Usage:
+    python startup_benchmark.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from config import STARTUP_BUDGET_MS
+
+STARTUP_MODULES = ("main", "cli")
+STARTUP_RUNS = 5
+# Must not be imported by `import main` / `import cli`
+STARTUP_LAZY_MODULES = ("numpy", "reedsolo", "table_codec", "batch_codec", "simulation",
+                        "random", "ui_utils", "render")
+
+
+class StartupResult(NamedTuple):
+    """Import timing of one entry point."""
+    module: str
+    median_ms: float
+    slowest: List[Tuple[str, float]]   # (module, self ms) of the costliest imports
+    eager: List[str]                   # STARTUP_LAZY_MODULES that module imported
+
+
+def import_times(module: Optional[str]) -> Dict[str, Tuple[float, float]]:
+    """
+    Import module in a fresh interpreter under -X importtime.
+
+    With module None the interpreter only starts up (`-c pass`), which gives
+    the modules site and the environment import on their own.
+
+    Returns:
+        Mapping of every imported module to its (self, cumulative) time in ms
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}" if module else "pass"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return times
+
+
+def measure(module: str, runs: int = STARTUP_RUNS) -> StartupResult:
+    """Median cumulative import time of module over several cold interpreters."""
+    import_times(module)  # warm-up: writes the .pyc files
+    samples = [import_times(module) for _ in range(runs)]
+    median_ms = statistics.median(times[module][1] for times in samples)
+    last = samples[-1]
+    slowest = sorted(((name, self_ms) for name, (self_ms, _) in last.items()),
+                     key=lambda item: item[1], reverse=True)[:5]
+    # Some interpreters (e.g. conda's) import modules such as random before
+    # any user code runs; only count what the import itself added
+    baseline = import_times(None)
+    eager = [name for name in STARTUP_LAZY_MODULES if name in last and name not in baseline]
+    return StartupResult(module, median_ms, slowest, eager)
+
+
+def main():
+    """Measure every entry point and exit non-zero when over budget."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else STARTUP_RUNS
+    failed = False
+    print(f"Import time, median of {runs} runs (budget {STARTUP_BUDGET_MS} ms):")
+    for module in STARTUP_MODULES:
+        result = measure(module, runs)
+        over = result.median_ms > STARTUP_BUDGET_MS
+        failed |= over or bool(result.eager)
+        print(f"  {module:<6}{result.median_ms:>8.1f} ms  {'OVER BUDGET' if over else 'ok'}")
+        print("        slowest: " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in result.slowest))
+        if result.eager:
+            print(f"        imported eagerly: {', '.join(result.eager)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
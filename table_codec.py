@@ -0,0 +1,320 @@
+"""In-project Reed-Solomon codec built on the precomputed GF(2^8) tables."""
+
+from typing import Iterable, List, Optional, Tuple
+
+from gf256 import GF_MUL, gf_div, gf_inverse, gf_poly_eval, gf_poly_mul, gf_pow, rs_generator_poly
+
+
+class UncorrectableError(Exception):
+    """Raised when a codeword holds more errata than the parity can repair."""
+
+
+def byte_view(buffer, writable: bool = False) -> memoryview:
+    """
+    Flat unsigned-byte memoryview over any buffer-protocol object.
+
+    Args:
+        buffer: bytes, bytearray, memoryview, mmap, array, numpy array, ...
+        writable: Require the underlying buffer to be writable
+
+    Returns:
+        A 1-D memoryview with format 'B' sharing the buffer's memory
+    """
+    view = memoryview(buffer)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    if writable and view.readonly:
+        raise TypeError("Output buffer must be writable.")
+    return view
+
+
+class TableRSCodec:
+    """
+    Reed-Solomon codec using table lookups instead of reedsolo's pure-Python math.
+
+    Codewords are bit-for-bit identical to ``reedsolo.RSCodec`` built with the
+    same parameters, including the chunking of long messages into
+    ``nsize``-byte blocks.
+    """
+
+    def __init__(self, nsym: int, nsize: int = 255, fcr: int = 0, generator: int = 2):
+        """
+        Precompute the generator polynomial and the parity feedback table.
+
+        Args:
+            nsym: Number of parity bytes per block
+            nsize: Maximum codeword (block) length, at most 255
+            fcr: First consecutive root exponent
+            generator: Primitive element of the field
+        """
+        if nsize > 255:
+            raise ValueError("GF(2^8) codewords are limited to 255 bytes.")
+        if not 0 < nsym < nsize:
+            raise ValueError("Parity bytes must be between 1 and nsize - 1.")
+
+        self.nsym = nsym
+        self.nsize = nsize
+        self.fcr = fcr
+        self.generator = generator
+        self.gen = rs_generator_poly(nsym, fcr, generator)
+
+        # The parity register is kept as one big integer (highest degree in the
+        # top byte); feedback[c] is the generator tail scaled by c, so each
+        # message byte costs a single shift/xor instead of nsym table lookups.
+        self._shift = 8 * (nsym - 1)
+        self._mask = (1 << (8 * nsym)) - 1
+        self._feedback = [
+            int.from_bytes(bytes(GF_MUL[c][g] for g in self.gen[1:]), "big")
+            for c in range(256)
+        ]
+        self.roots = [gf_pow(generator, fcr + j) for j in range(nsym)]
+        self._root_scale = [gf_pow(root, -nsym) for root in self.roots]
+
+    @property
+    def block_data_size(self) -> int:
+        """Number of message bytes carried by a full block."""
+        return self.nsize - self.nsym
+
+    def encoded_size(self, data_size: int) -> int:
+        """Length of the codewords produced for data_size message bytes."""
+        n_blocks = -(-data_size // self.block_data_size)
+        return data_size + n_blocks * self.nsym
+
+    def decoded_size(self, codeword_size: int) -> int:
+        """
+        Length of the message carried by codeword_size bytes of codewords.
+
+        A trailing fragment no longer than the parity carries no data and
+        adds nothing; decoding it raises UncorrectableError.
+        """
+        full, tail = divmod(codeword_size, self.nsize)
+        return full * self.block_data_size + max(tail - self.nsym, 0)
+
+    def _remainder(self, data: Iterable[int]) -> int:
+        """Return data(x) * x^nsym mod g(x), packed into an integer."""
+        feedback = self._feedback
+        shift = self._shift
+        mask = self._mask
+        r = 0
+        for b in data:
+            r = ((r << 8) & mask) ^ feedback[(r >> shift) ^ b]
+        return r
+
+    def encode(self, data: bytes) -> bytearray:
+        """
+        Encode a message, chunking it into blocks of nsize - nsym bytes.
+
+        Args:
+            data: The message bytes
+
+        Returns:
+            The concatenated codewords (data bytes followed by parity, per block)
+        """
+        k = self.block_data_size
+        nsym = self.nsym
+        out = bytearray()
+        for start in range(0, len(data), k):
+            chunk = data[start:start + k]
+            out += chunk
+            out += self._remainder(chunk).to_bytes(nsym, "big")
+        return out
+
+    def encode_into(self, data, out) -> int:
+        """
+        Encode a buffer directly into a caller-supplied output buffer.
+
+        Args:
+            data: Any buffer-protocol object holding the message
+            out: Writable buffer of at least encoded_size(len(data)) bytes
+
+        Returns:
+            Number of bytes written to out
+        """
+        src = byte_view(data)
+        dst = byte_view(out, writable=True)
+        size = self.encoded_size(len(src))
+        if len(dst) < size:
+            raise ValueError(f"Output buffer too small: need {size} bytes, got {len(dst)}.")
+
+        k = self.block_data_size
+        nsym = self.nsym
+        pos = 0
+        for start in range(0, len(src), k):
+            chunk = src[start:start + k]
+            end = pos + len(chunk)
+            dst[pos:end] = chunk
+            dst[end:end + nsym] = self._remainder(chunk).to_bytes(nsym, "big")
+            pos = end + nsym
+        return pos
+
+    def decode_into(self, data, out, erase_pos: Optional[List[int]] = None) -> Tuple[int, List[int]]:
+        """
+        Decode a buffer of codewords directly into a caller-supplied buffer.
+
+        Clean blocks are copied straight from the input; only corrupted blocks
+        are copied aside for repair. The input buffer is never modified.
+
+        Args:
+            data: Any buffer-protocol object holding the codewords
+            out: Writable buffer of at least decoded_size(len(data)) bytes
+            erase_pos: Known-bad positions, relative to the start of data
+
+        Returns:
+            Tuple of (bytes_written, errata_positions)
+
+        Raises:
+            UncorrectableError: If any block cannot be repaired
+        """
+        src = byte_view(data)
+        dst = byte_view(out, writable=True)
+        size = self.decoded_size(len(src))
+        if len(dst) < size:
+            raise ValueError(f"Output buffer too small: need {size} bytes, got {len(dst)}.")
+
+        erase_pos = sorted(erase_pos) if erase_pos else []
+        nsize = self.nsize
+        nsym = self.nsym
+        pos = 0
+        errata_pos = []
+        for start in range(0, len(src), nsize):
+            block = src[start:start + nsize]
+            block_erasures = [p - start for p in erase_pos if start <= p < start + nsize]
+            if len(block) <= nsym or block_erasures or self._remainder(block) != 0:
+                repaired = bytearray(block)
+                errata_pos.extend(start + p for p in self.correct_block(repaired, block_erasures))
+                block = memoryview(repaired)
+            end = pos + len(block) - nsym
+            dst[pos:end] = block[:-nsym]
+            pos = end
+        return pos, errata_pos
+
+    def decode(self, data: bytes,
+               erase_pos: Optional[List[int]] = None) -> Tuple[bytearray, bytearray, List[int]]:
+        """
+        Decode (and repair) one or more concatenated codewords.
+
+        Args:
+            data: The received codewords
+            erase_pos: Known-bad positions, relative to the start of data
+
+        Returns:
+            Tuple of (decoded_bytes, decoded_codeword, errata_positions)
+
+        Raises:
+            UncorrectableError: If any block cannot be repaired
+        """
+        data = bytearray(data)
+        erase_pos = sorted(erase_pos) if erase_pos else []
+        nsize = self.nsize
+        nsym = self.nsym
+        decoded = bytearray()
+        errata_pos = []
+        for start in range(0, len(data), nsize):
+            block = data[start:start + nsize]
+            block_erasures = [p - start for p in erase_pos if start <= p < start + nsize]
+            errata_pos.extend(start + p for p in self.correct_block(block, block_erasures))
+            data[start:start + nsize] = block
+            decoded += block[:-nsym]
+        return decoded, data, errata_pos
+
+    def _syndromes(self, remainder: int) -> List[int]:
+        """Syndromes S_j = c(generator^(fcr + j)), derived from the remainder."""
+        rem = remainder.to_bytes(self.nsym, "big")
+        # rem(x) = c(x) * x^nsym mod g(x) and every root of g zeroes g, so
+        # c(root) = rem(root) / root^nsym; this costs nsym^2 lookups instead of n*nsym.
+        return [
+            GF_MUL[gf_poly_eval(rem, root)][scale]
+            for root, scale in zip(self.roots, self._root_scale)
+        ]
+
+    def correct_block(self, block: bytearray, erase_pos: List[int]) -> List[int]:
+        """
+        Repair a single codeword in place.
+
+        Args:
+            block: One codeword of at most nsize bytes (modified in place)
+            erase_pos: Known-bad positions within the block
+
+        Returns:
+            Sorted list of the positions that were corrected or erased
+        """
+        nsym = self.nsym
+        if len(block) <= nsym:
+            raise UncorrectableError("Codeword is shorter than its parity")
+        if len(erase_pos) > nsym:
+            raise UncorrectableError("Too many erasures to correct")
+        for p in erase_pos:
+            block[p] = 0
+
+        remainder = self._remainder(block)
+        if remainder == 0:
+            return list(erase_pos)
+
+        synd = self._syndromes(remainder)
+        n = len(block)
+        generator = self.generator
+
+        # Erasure locator Gamma(x) = prod(1 + X_k x), X_k = generator^(n-1-p)
+        # (all locator polynomials below are stored lowest degree first)
+        n_erasures = len(erase_pos)
+        erase_loc = [1]
+        for p in erase_pos:
+            erase_loc = gf_poly_mul(erase_loc, [1, gf_pow(generator, n - 1 - p)])
+
+        # Berlekamp-Massey seeded with the erasure locator
+        err_loc = list(erase_loc)
+        prev = list(erase_loc)
+        length = n_erasures
+        for r in range(n_erasures, nsym):
+            delta = 0
+            for i in range(min(len(err_loc), r + 1)):
+                delta ^= GF_MUL[err_loc[i]][synd[r - i]]
+            shifted = [0] + prev
+            if delta == 0:
+                prev = shifted
+                continue
+            size = max(len(err_loc), len(shifted))
+            row = GF_MUL[delta]
+            updated = [
+                a ^ row[b] for a, b in zip(err_loc + [0] * (size - len(err_loc)),
+                                           shifted + [0] * (size - len(shifted)))
+            ]
+            if 2 * length <= r + n_erasures:
+                inv_row = GF_MUL[gf_inverse(delta)]
+                prev = [inv_row[c] for c in err_loc]
+                length = r + 1 + n_erasures - length
+            else:
+                prev = shifted
+            err_loc = updated
+
+        while len(err_loc) > 1 and err_loc[-1] == 0:
+            err_loc.pop()
+        n_errors = length - n_erasures
+        if 2 * n_errors + n_erasures > nsym or len(err_loc) - 1 != length:
+            raise UncorrectableError("Too many errors to correct")
+
+        # Chien search: position p is in error when err_loc(X_p^-1) == 0
+        err_loc_high = err_loc[::-1]
+        positions = [
+            p for p in range(n)
+            if gf_poly_eval(err_loc_high, gf_pow(generator, p + 1 - n)) == 0
+        ]
+        if len(positions) != length:
+            raise UncorrectableError("Could not locate error")
+
+        # Forney: e_k = X_k^(1-fcr) * omega(X_k^-1) / err_loc'(X_k^-1)
+        omega_high = gf_poly_mul(synd, err_loc)[:nsym][::-1]
+        deriv = [err_loc[i] if i % 2 else 0 for i in range(1, len(err_loc))]
+        deriv_high = deriv[::-1]
+        for p in positions:
+            x = gf_pow(generator, n - 1 - p)
+            x_inv = gf_inverse(x)
+            denom = gf_poly_eval(deriv_high, x_inv)
+            if denom == 0:
+                raise UncorrectableError("Could not correct message")
+            magnitude = gf_div(gf_poly_eval(omega_high, x_inv), denom)
+            block[p] ^= GF_MUL[gf_pow(x, 1 - self.fcr)][magnitude]
+
+        if self._remainder(block) != 0:
+            raise UncorrectableError("Could not correct message")
+        return positions
@@ -0,0 +1,50 @@
+"""Tests for the closed-form error rates and their cache."""
+
+import os
+
+import pytest
+
+import analytic
+
+
+@pytest.fixture
+def cache_at():
+    """Point the result cache somewhere else for one test."""
+    yield analytic.set_cache_path
+    analytic.set_cache_path(None)
+
+
+def test_error_rates_match_binomial_tail(cache_at):
+    cache_at("")
+    fer, _ = analytic.error_rates(255, 223, 0.01)
+    assert fer == pytest.approx(analytic.binomial_tail(255, 17, 0.01))
+
+
+def test_cache_written_to_configured_path(cache_at, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache_at(str(tmp_path / "cache" / "analytic"))
+    analytic.error_rates(255, 239, 0.001)
+    assert os.listdir(tmp_path / "cache")
+    assert os.listdir(tmp_path) == ["cache"]   # nothing written to the working directory
+
+
+def test_unopenable_cache_falls_back_to_memory(cache_at, tmp_path):
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    cache_at(str(blocker / "analytic"))
+    fer, ber = analytic.error_rates(255, 247, 0.002)
+    assert 0 < ber <= fer < 1
+    assert isinstance(analytic._cache, dict)
+
+
+def test_ber_matches_simulated_data_byte_error_rate(cache_at):
+    from simulation import operating_points, sweep
+
+    cache_at("")
+    predicted = analytic.level_performance("M", analytic.CHANNEL_BSC, 0.01, message_len=64)
+    point = operating_points(["M"], bit_error_rates=[0.01], message_len=64)
+    simulated = sweep(point, trials=5000, seed=3, workers=1)[0]
+    # Both count wrong data bytes over k; the simulator also sees the rare
+    # miscorrections that bounded-distance analysis leaves out
+    assert simulated.fer == pytest.approx(predicted.fer, rel=0.1)
+    assert simulated.ber == pytest.approx(predicted.ber, rel=0.1)
@@ -0,0 +1,60 @@
+"""Tests for cli.py argument validation and error reporting."""
+
+import json
+
+import pytest
+
+import cli
+
+
+@pytest.mark.parametrize("argv", [
+    ["corrupt", "-m", "awgn", "-e", "2"],   # awgn without --sigma
+    ["corrupt", "-m", "bsc"],               # bsc without --ber
+    ["corrupt", "-e", "-3"],
+    ["corrupt", "-m", "bsc", "--ber", "2"],
+])
+def test_corrupt_rejects_invalid_options(argv, tmp_path):
+    data = tmp_path / "data.bin"
+    data.write_bytes(b"hello world")
+    with pytest.raises(SystemExit) as exc:
+        cli.main(argv + ["-i", str(data)])
+    assert exc.value.code == 2
+
+
+def test_decode_truncated_input_reports_failure(tmp_path, capsys):
+    truncated = tmp_path / "truncated.rs"
+    truncated.write_bytes(b"abc")
+    assert cli.main(["decode", "-i", str(truncated)]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["success"] is False
+
+
+@pytest.mark.parametrize("command", ["stream-encode", "stream-decode"])
+@pytest.mark.parametrize("chunk_blocks", ["0", "-1"])
+def test_stream_rejects_non_positive_chunk_blocks(command, chunk_blocks):
+    with pytest.raises(SystemExit) as exc:
+        cli.main([command, "--chunk-blocks", chunk_blocks])
+    assert exc.value.code == 2
+
+
+@pytest.mark.parametrize("argv", [
+    ["--errors", "500"],
+    ["--levels", "H", "--bursts", "40", "--message-len", "7"],
+    ["--errors", "4", "--message-len", "250"],
+    ["--errors", "4", "--trials", "0"],
+    ["--errors", "4", "--workers", "-2"],
+    ["--errors", "4", "--shard", "0", "2"],            # --shard without --checkpoint
+    ["--errors", "4", "--shard", "2", "2", "--checkpoint", "sweep.json"],
+])
+def test_simulate_rejects_invalid_options(argv):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["simulate"] + argv)
+    assert exc.value.code == 2
+
+
+def test_corrupt_reports_too_many_errors_as_json(tmp_path, capsys):
+    data = tmp_path / "data.bin"
+    data.write_bytes(b"short")
+    assert cli.main(["corrupt", "-i", str(data), "-e", "6"]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["error"] == "cannot corrupt 6 of 5 bytes"
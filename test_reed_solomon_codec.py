@@ -0,0 +1,22 @@
+"""Tests for the ReedSolomonEncoder wrapper."""
+
+import pytest
+
+from config import CODEC_BACKEND_REEDSOLO, CODEC_BACKEND_TABLE, ERROR_CORRECTION_LEVELS
+from reed_solomon_codec import ReedSolomonEncoder
+
+
+@pytest.mark.parametrize("backend", [CODEC_BACKEND_REEDSOLO, CODEC_BACKEND_TABLE])
+def test_decode_errata_uses_erasures_beyond_blind_capacity(backend):
+    codec = ReedSolomonEncoder(ERROR_CORRECTION_LEVELS["L"], backend=backend)
+    message, codeword = codec.encode("erasures cost one parity byte")
+    received = bytearray(codeword)
+    for pos in (0, 3, 7, 11, 19, 25):
+        received[pos] ^= 0xFF
+
+    # Six unknown errors exceed the four that 8 parity bytes can locate...
+    assert codec.decode_errata(received)[0] is False
+    # ...but four of them flagged as erasures leave 2 * 2 + 4 <= 8
+    assert codec.decode_errata(received, [0, 3, 7, 11]) == (True, message, 4, 2)
+    # A flagged position that was not corrupted is still only an erasure
+    assert codec.decode_errata(received, [0, 3, 7, 11, 19, 25, 30]) == (True, message, 7, 0)
@@ -0,0 +1,19 @@
+"""Tests for the size-bounded byte rendering."""
+
+from render import hex_windows
+
+
+def test_hex_windows_print_each_row_once_with_all_marks():
+    original = bytes(range(256))
+    received = bytearray(original)
+    # 0x41 and 0x4c are more than two radii apart but share row 0x40
+    positions = [0x41, 0x4c, 0xa0]
+    for pos in positions:
+        received[pos] ^= 0xff
+
+    lines = hex_windows(original, received, positions, radius=4, width=16)
+
+    recv_rows = [line.split()[1] for line in lines if line.startswith("    recv")]
+    assert recv_rows == ["00000030", "00000040", "00000050", "00000090", "000000a0"]
+    row_40 = next(line for line in lines if line.startswith("    recv 00000040"))
+    assert "[be]" in row_40 and "[b3]" in row_40
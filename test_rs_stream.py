@@ -0,0 +1,68 @@
+"""Tests for the streaming encoder/decoder."""
+
+import io
+import os
+
+import pytest
+
+from config import ERROR_CORRECTION_LEVELS
+from reed_solomon_codec import ReedSolomonEncoder
+from rs_parallel import parallel_decode
+from rs_stream import decode_file_mmap, decode_stream, encode_stream
+
+
+def test_stream_round_trip():
+    data = os.urandom(5000)
+    encoded = io.BytesIO()
+    encode_stream(io.BytesIO(data), encoded, "M", chunk_blocks=3)
+    decoded = io.BytesIO()
+    report = decode_stream(io.BytesIO(encoded.getvalue()), decoded, "M", chunk_blocks=2)
+    assert decoded.getvalue() == data
+    assert report.failed_blocks == 0
+
+
+def test_truncated_final_codeword_is_a_failed_block():
+    data = os.urandom(1000)
+    encoded = io.BytesIO()
+    encode_stream(io.BytesIO(data), encoded, "H")
+    # Four whole codewords plus 30 bytes, fewer than the 32 parity bytes
+    truncated = encoded.getvalue()[:4 * 255 + 30]
+    blocks = []
+    decoded = io.BytesIO()
+    report = decode_stream(io.BytesIO(truncated), decoded, "H",
+                           on_block=lambda *block: blocks.append(block))
+    assert decoded.getvalue() == data[:4 * 223]
+    assert (report.blocks, report.failed_blocks) == (5, 1)
+    assert blocks[-1] == (4, 0, False)
+
+
+@pytest.mark.parametrize("run", [encode_stream, decode_stream])
+@pytest.mark.parametrize("chunk_blocks", [0, -1])
+def test_stream_rejects_empty_chunks(run, chunk_blocks):
+    with pytest.raises(ValueError):
+        run(io.BytesIO(b"hello world"), io.BytesIO(), "M", chunk_blocks=chunk_blocks)
+
+
+def test_truncated_tail_agrees_across_decoders(tmp_path):
+    data = os.urandom(3 * 231)
+    encoded = io.BytesIO()
+    encode_stream(io.BytesIO(data), encoded, "Q")
+    # Three whole codewords plus 10 bytes, fewer than the 24 parity bytes
+    truncated = encoded.getvalue() + b"\x00" * 10
+
+    decoded = io.BytesIO()
+    report = decode_stream(io.BytesIO(truncated), decoded, "Q")
+    assert decoded.getvalue() == data
+    assert (report.blocks, report.failed_blocks) == (4, 1)
+
+    src, dst = tmp_path / "truncated.rs", tmp_path / "decoded.bin"
+    src.write_bytes(truncated)
+    assert decode_file_mmap(str(src), str(dst), "Q") == report
+    assert dst.read_bytes() == data
+
+    parallel = parallel_decode(truncated, "Q", workers=2)
+    assert bytes(parallel.data) == data
+    assert (parallel.corrected, parallel.failed_blocks) == (0, 1)
+
+    success, decoded_bytes = ReedSolomonEncoder(ERROR_CORRECTION_LEVELS["Q"]).decode_bytes(truncated)
+    assert (success, decoded_bytes) == (False, None)
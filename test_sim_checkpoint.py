@@ -0,0 +1,25 @@
+"""Tests for checkpointed simulation sweeps."""
+
+import pytest
+
+from sim_checkpoint import Checkpoint, checkpointed_sweep
+from simulation import operating_points, sweep
+
+POINTS = operating_points(["M"], error_counts=[9])
+
+
+def test_resume_with_more_trials_matches_uninterrupted_sweep(tmp_path):
+    path = str(tmp_path / "sweep.json")
+    checkpointed_sweep(POINTS, path, trials=2000, seed=3, workers=1, chunk_trials=500)
+    resumed = checkpointed_sweep(POINTS, path, trials=3200, seed=3, workers=1, chunk_trials=500)
+    full = sweep(POINTS, 3200, seed=3, workers=1, chunk_trials=500)
+    assert resumed == full
+
+
+def test_resume_rejects_a_changed_chunk_size(tmp_path):
+    path = str(tmp_path / "sweep.json")
+    checkpointed_sweep(POINTS, path, trials=1200, seed=3, workers=1, chunk_trials=500)
+    # Chunk 2 ran 200 trials; with 2000 trials per point it would run 500
+    with pytest.raises(ValueError, match="chunks 2..2"):
+        checkpointed_sweep(POINTS, path, trials=2000, seed=3, workers=1, chunk_trials=500)
+    assert Checkpoint.load(path).results()[0].trials == 1200
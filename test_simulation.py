@@ -0,0 +1,15 @@
+"""Tests for the Monte Carlo simulation engine."""
+
+from simulation import operating_points, sweep
+
+
+def test_sweep_is_identical_for_any_worker_count():
+    points = operating_points(["L", "H"], error_counts=[4, 17], sigmas=[0.5], message_len=32)
+
+    serial = sweep(points, trials=300, seed=7, batch_size=64, workers=1, chunk_trials=100)
+    parallel = sweep(points, trials=300, seed=7, batch_size=64, workers=3, chunk_trials=100)
+
+    assert parallel == serial
+    # Some point fails only part of the time, so the counts depend on every
+    # chunk's random stream
+    assert any(0 < r.frame_errors < r.trials for r in serial)
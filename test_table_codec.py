@@ -0,0 +1,63 @@
+"""Tests for the table-driven Reed-Solomon codec."""
+
+import random
+
+import pytest
+import reedsolo
+
+from config import ERROR_CORRECTION_LEVELS
+from table_codec import TableRSCodec
+
+LEVELS = sorted(ERROR_CORRECTION_LEVELS)
+# Shortened single blocks, the full block of each level and multi-block
+# messages whose last block is shortened
+MESSAGE_LENGTHS = [1, 40, 200, 223, 231, 239, 247, 600, 1000]
+
+
+def corrupt_within_budget(codeword: bytearray, codec: TableRSCodec, rng: random.Random):
+    """
+    Give every block e random errors and f erasures with 2e + f <= nsym.
+
+    Erased bytes are XORed with a value that may be zero, so some flagged
+    positions are still correct.
+
+    Returns:
+        The erased positions, relative to the start of codeword
+    """
+    erase_pos = []
+    for start in range(0, len(codeword), codec.nsize):
+        n = min(codec.nsize, len(codeword) - start)
+        n_erasures = rng.randint(0, codec.nsym)
+        n_errors = rng.randint(0, (codec.nsym - n_erasures) // 2)
+        positions = rng.sample(range(n), n_errors + n_erasures)
+        for pos in positions[:n_erasures]:
+            codeword[start + pos] ^= rng.randrange(256)
+            erase_pos.append(start + pos)
+        for pos in positions[n_erasures:]:
+            codeword[start + pos] ^= rng.randrange(1, 256)
+    return erase_pos
+
+
+@pytest.mark.parametrize("length", MESSAGE_LENGTHS)
+@pytest.mark.parametrize("level", LEVELS)
+def test_encode_matches_reedsolo(level, length):
+    nsym = ERROR_CORRECTION_LEVELS[level]
+    message = random.Random(length).randbytes(length)
+    assert TableRSCodec(nsym).encode(message) == reedsolo.RSCodec(nsym).encode(message)
+
+
+@pytest.mark.parametrize("length", MESSAGE_LENGTHS)
+@pytest.mark.parametrize("level", LEVELS)
+def test_decode_repairs_errors_and_erasures_within_budget(level, length):
+    codec = TableRSCodec(ERROR_CORRECTION_LEVELS[level])
+    rng = random.Random(f"{level}-{length}")
+    message = rng.randbytes(length)
+    codeword = codec.encode(message)
+    for _ in range(20):
+        received = bytearray(codeword)
+        erase_pos = corrupt_within_budget(received, codec, rng)
+
+        decoded, repaired, _ = codec.decode(received, erase_pos)
+
+        assert decoded == message
+        assert repaired == codeword
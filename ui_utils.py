@@ -1,10 +1,62 @@
 
+import sys
 import time
-from config import ANIMATION_STEPS, ANIMATION_DELAY
+from contextlib import contextmanager
+from typing import Optional
+
+from config import (
+    ANIMATION_STEPS, ANIMATION_DELAY, CORRUPTION_MODE_AWGN, CORRUPTION_MODE_BURST,
+    CORRUPTION_MODE_GE, RENDER_MAX_ITEMS
+)
+from render import elide_lines, hex_windows, page_hexdump, summarize, summarize_text, write_lines
+
+# Presentation switches set by configure_presentation(); None means "only
+# when stdout is a terminal", so piped, batch and library use stay silent
+_animations: Optional[bool] = None
+_verbose: Optional[bool] = None
+
+
+def configure_presentation(animations: Optional[bool] = None, verbose: Optional[bool] = None):
+    """
+    Turn animation and the verbose explanations on or off.
+
+    Args:
+        animations: Show dot animations (None: only on a terminal)
+        verbose: Print the step-by-step explanations (None: only on a terminal)
+    """
+    global _animations, _verbose
+    _animations = animations
+    _verbose = verbose
+
+
+def _on_terminal() -> bool:
+    """Whether stdout is an interactive terminal."""
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+def animations_enabled() -> bool:
+    """Whether animate() and animating() draw anything."""
+    return _on_terminal() if _animations is None else _animations
+
+
+def verbose_enabled() -> bool:
+    """Whether the explanatory print_* helpers produce output."""
+    return _on_terminal() if _verbose is None else _verbose
 
 
 def animate(message: str, steps: int = ANIMATION_STEPS, delay: float = ANIMATION_DELAY):
-    """Simple terminal 'animation' with dots."""
+    """
+    Simple terminal 'animation' with dots.
+
+    This sleeps for steps * delay seconds, so it returns immediately (printing
+    just the message in verbose mode) when animations are disabled. Prefer
+    animating() around real work.
+    """
+    if not animations_enabled():
+        if verbose_enabled():
+            print(message)
+        return
     print(message, end="", flush=True)
     for _ in range(steps):
         print(".", end="", flush=True)
@@ -12,6 +64,45 @@ def animate(message: str, steps: int = ANIMATION_STEPS, delay: float = ANIMATION
     print()  # newline
 
 
+@contextmanager
+def animating(message: str, delay: float = ANIMATION_DELAY):
+    """
+    Animate dots while the body of a with-block runs.
+
+    The dots are drawn by a background thread, so the work inside the block
+    (and an asyncio event loop running it) is never delayed; the animation
+    stops as soon as the block exits.
+
+        with animating("Locating and correcting errors"):
+            result = encoder.decode(received)
+    """
+    if not animations_enabled():
+        if verbose_enabled():
+            print(message)
+        yield
+        return
+
+    import threading
+    
+    stop = threading.Event()
+
+    def draw():
+        while True:
+            print(".", end="", flush=True)
+            if stop.wait(delay):
+                break
+
+    print(message, end="", flush=True)
+    thread = threading.Thread(target=draw, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+        print()  # newline
+
+
 def print_header(title: str, width: int = 70):
     """Print a formatted header."""
     print("=" * width)
@@ -29,6 +120,8 @@ def print_section(title: str, width: int = 70):
 
 def print_ec_levels():
     """Display available error correction levels."""
+    if not verbose_enabled():
+        return
     print("QR-style error correction levels (simplified for this demo):")
     print("  L (Low)      →  8 parity bytes  (can correct up to 4 byte errors)")
     print("  M (Medium)   → 16 parity bytes  (can correct up to 8 byte errors)")
@@ -39,72 +132,101 @@ def print_ec_levels():
 
 def print_encoding_info(message: str, message_bytes: bytes, encoded_bytes: bytes, 
                        ec_level: str, n_parity: int):
-    """Display encoding information."""
-    print(f"Original message: '{message}'")
-    print(f"Message bytes ({len(message_bytes)} data bytes):")
-    print(f"  {list(message_bytes)}")
-    print()
-    
+    """Display encoding information (long arrays are summarized, see render.py)."""
+    if not verbose_enabled():
+        return
     max_correctable = n_parity // 2
-    print(f"Chosen EC level: {ec_level}")
-    print(f"Parity bytes added (error correction code): {n_parity}")
-    print(f"Maximum correctable byte errors (t = n_parity/2): {max_correctable}")
-    print()
-    
-    print("Full codeword (data bytes + parity bytes):")
-    print(f"  {list(encoded_bytes)}")
-    print(f"Total length: {len(encoded_bytes)} bytes")
-    print()
-    
-    # Show data and parity parts
     data_len = len(message_bytes)
-    data_part = list(encoded_bytes[:data_len])
-    parity_part = list(encoded_bytes[data_len:])
-    
-    print("Data part (original message bytes):")
-    print(f"  indices 0 .. {data_len - 1}")
-    print(f"  {data_part}")
-    print()
+    data_part = encoded_bytes[:data_len]
+    parity_part = encoded_bytes[data_len:]
     
-    print("Error correction code (ECC bytes / parity bytes):")
-    print(f"  indices {data_len} .. {len(encoded_bytes) - 1}")
-    print(f"  Raw ECC bytes: {parity_part}")
-    print("  ECC bytes one by one:")
-    for i, b in enumerate(parity_part):
-        print(f"    ECC[{i}] at codeword position {data_len + i}: {b}")
-    print()
-    
-    print("CONCEPTUAL VIEW OF ENCODING:")
-    print("  • Treat the message bytes as coefficients of a polynomial M(x).")
-    print("  • Reed–Solomon constructs a generator polynomial G(x).")
-    print("  • It computes parity bytes as the remainder when M(x) * x^n_parity")
-    print("    is divided by G(x).")
-    print("  • Those remainder bytes are the ECC (the parity bytes you see above).")
-    print()
+    lines = [
+        f"Original message: '{summarize_text(message)}'",
+        f"Message bytes ({len(message_bytes)} data bytes):",
+        f"  {summarize(message_bytes)}",
+        "",
+        f"Chosen EC level: {ec_level}",
+        f"Parity bytes added (error correction code): {n_parity}",
+        f"Maximum correctable byte errors (t = n_parity/2): {max_correctable}",
+        "",
+        "Full codeword (data bytes + parity bytes):",
+        f"  {summarize(encoded_bytes)}",
+        f"Total length: {len(encoded_bytes)} bytes",
+        "",
+        # Show data and parity parts
+        "Data part (original message bytes):",
+        f"  indices 0 .. {data_len - 1}",
+        f"  {summarize(data_part)}",
+        "",
+        "Error correction code (ECC bytes / parity bytes):",
+        f"  indices {data_len} .. {len(encoded_bytes) - 1}",
+        f"  Raw ECC bytes: {summarize(parity_part)}",
+        "  ECC bytes one by one:",
+    ]
+    lines.extend(elide_lines(
+        [f"    ECC[{i}] at codeword position {data_len + i}: {b}" for i, b in enumerate(parity_part)],
+        indent="    "
+    ))
+    lines += [
+        "",
+        "CONCEPTUAL VIEW OF ENCODING:",
+        "  • Treat the message bytes as coefficients of a polynomial M(x).",
+        "  • Reed–Solomon constructs a generator polynomial G(x).",
+        "  • It computes parity bytes as the remainder when M(x) * x^n_parity",
+        "    is divided by G(x).",
+        "  • Those remainder bytes are the ECC (the parity bytes you see above).",
+        "",
+    ]
+    write_lines(lines)
 
 
 def print_corruption_info(encoded_bytes: bytes, corrupted_bytes: bytearray, 
                          corruption_positions: list, mode: str, noise_sigma: float = None):
-    """Display corruption information."""
+    """
+    Display corruption information.
+    
+    Short codewords are printed in full; longer ones as hex windows around
+    the corrupted positions (use print_hexdump() for the whole codeword).
+    """
+    if not verbose_enabled():
+        return
     if len(corruption_positions) == 0:
-        print("No corruption applied. The codeword is transmitted perfectly.")
-        print()
+        write_lines(["No corruption applied. The codeword is transmitted perfectly.", ""])
         return
     
-    print(f"Corrupting {len(corruption_positions)} byte(s) at positions: {corruption_positions}")
-    print()
-    print("Original codeword:")
-    print(f"  {list(encoded_bytes)}")
-    print()
-    print("Corrupted codeword:")
-    print(f"  {list(corrupted_bytes)}")
-    print()
-    print("Corrupted message:")
-    print(f"{corrupted_bytes.decode('utf-8', errors='replace')}")
+    lines = [
+        f"Corrupting {len(corruption_positions)} byte(s) at positions: {summarize(corruption_positions)}",
+        "",
+    ]
+    if len(encoded_bytes) <= RENDER_MAX_ITEMS:
+        lines += [
+            "Original codeword:",
+            f"  {list(encoded_bytes)}",
+            "",
+            "Corrupted codeword:",
+            f"  {list(corrupted_bytes)}",
+            "",
+        ]
+    else:
+        lines.append(f"Codeword around the corrupted bytes (sent vs received, {len(encoded_bytes)} bytes):")
+        lines.extend(hex_windows(encoded_bytes, corrupted_bytes, corruption_positions))
+        lines.append("")
+    lines += [
+        "Corrupted message:",
+        summarize_text(corrupted_bytes.decode('utf-8', errors='replace')),
+    ]
+    write_lines(lines)
+
+
+def print_hexdump(data: bytes, marked: list = ()):
+    """Page through a full hexdump of data, bracketing the marked positions."""
+    page_hexdump(data, marked)
 
 
 def print_decoding_concept():
     """Print the conceptual view of Reed-Solomon decoding."""
+    if not verbose_enabled():
+        return
     print("CONCEPTUAL VIEW OF DECODING (what Reed–Solomon does internally):")
     print("  1) Compute 'syndromes' from the received codeword.")
     print("     • If all syndromes are zero → no errors.")
@@ -132,7 +254,14 @@ def print_summary(original_message: str, ec_level: str, n_parity: int,
     print(f"Chosen EC level:           {ec_level} ({n_parity} parity bytes)")
     print(f"Maximum correctable bytes: {max_correctable}")
     print(f"Bytes requested to corrupt:{n_errors}")
-    corruption_model = 'XOR random errors' if mode == '1' else f'AWGN-like (σ={noise_sigma})'
+    if mode == CORRUPTION_MODE_AWGN:
+        corruption_model = f'AWGN-like (σ={noise_sigma})'
+    elif mode == CORRUPTION_MODE_BURST:
+        corruption_model = 'Burst of consecutive XOR errors'
+    elif mode == CORRUPTION_MODE_GE:
+        corruption_model = 'Gilbert–Elliott burst channel'
+    else:
+        corruption_model = 'XOR random errors'
     print(f"Corruption model:          {corruption_model}")
     print(f"Decoding result:           {'SUCCESS' if success else 'FAILED'}")
     if success and decoded_message: